@@ -124,14 +124,15 @@ class SmartIngestion:
                 return current_count
 
             # Save to database (automatic deduplication)
-            saved_count = self.data_manager.save_games(games)
+            games_new, games_updated = self.data_manager.save_games(games)
+            saved_count = games_new + games_updated
 
             # Log successful completion
             self.data_manager.log_ingestion(
                 batch_id=batch_id,
                 games_fetched=len(games),
-                games_new=saved_count,  # Assuming all are new for simplicity
-                games_updated=0,
+                games_new=games_new,
+                games_updated=games_updated,
                 status="completed",
             )
 
@@ -216,14 +217,15 @@ class SmartIngestion:
                 return current_count
 
             # Save to database
-            saved_count = self.data_manager.save_games(games)
+            games_new, games_updated = self.data_manager.save_games(games)
+            saved_count = games_new + games_updated
 
             # Log completion
             self.data_manager.log_ingestion(
                 batch_id=batch_id,
                 games_fetched=len(games),
-                games_new=saved_count,
-                games_updated=0,
+                games_new=games_new,
+                games_updated=games_updated,
                 status="completed",
             )
 
@@ -397,7 +399,8 @@ class SmartIngestion:
                 games = self.igdb_client._make_request("games", query)
 
                 if games:
-                    saved_count = self.data_manager.save_games(games)
+                    games_new, games_updated = self.data_manager.save_games(games)
+                    saved_count = games_new + games_updated
                     total_fetched += saved_count
                     logger.info(f"✅ {strategy_name}: Saved {saved_count} games")
                 else:
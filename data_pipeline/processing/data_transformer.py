@@ -17,7 +17,6 @@ Key Features:
 import logging
 import json
 from typing import Dict, List, Any, Optional
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -148,43 +147,46 @@ class DataTransformer:
             >>> print(clean_game['genre_names'])
         """
         try:
-            # Basic info
-            clean_game = {
+            # Read each raw field once into locals; the clean record is then
+            # built as a single dict literal instead of repeated dict writes
+            name = (raw_game.get("name") or "").strip()
+            summary = (raw_game.get("summary") or "").strip()
+            rating = self._clean_rating(raw_game.get("rating"))
+            release_timestamp = raw_game.get("first_release_date")
+            genre_ids = raw_game.get("genres", [])
+            platform_ids = raw_game.get("platforms", [])
+            theme_ids = raw_game.get("themes", [])
+            summary_length = len(summary)
+            name_length = len(name)
+
+            genre_names = self._resolve_genres(genre_ids)
+            platform_names = self._resolve_platforms(platform_ids)
+            theme_names = self._resolve_themes(theme_ids)
+
+            return {
                 "id": raw_game.get("id"),
-                "name": (raw_game.get("name") or "").strip(),
-                "summary": (raw_game.get("summary") or "").strip(),
-                "rating": self._clean_rating(raw_game.get("rating")),
+                "name": name,
+                "summary": summary,
+                "rating": rating,
                 "rating_count": raw_game.get("rating_count") or 0,
-                "release_date": self._clean_release_date(
-                    raw_game.get("first_release_date")
-                ),
-                "release_year": self._extract_year(raw_game.get("first_release_date")),
+                "release_date": self._clean_release_date(release_timestamp),
+                "release_year": self._extract_year(release_timestamp),
+                # Resolved names with original IDs kept for reference
+                "genre_names": genre_names,
+                "platform_names": platform_names,
+                "theme_names": theme_names,
+                "genre_ids": genre_ids,
+                "platform_ids": platform_ids,
+                "theme_ids": theme_ids,
+                # Text metrics and quality indicators
+                "summary_length": summary_length,
+                "name_length": name_length,
+                "has_summary": summary_length > 0,
+                "has_rating": rating is not None,
+                "has_genres": len(genre_names) > 0,
+                "has_platforms": len(platform_names) > 0,
             }
 
-            # Resolve IDs to names
-            clean_game["genre_names"] = self._resolve_genres(raw_game.get("genres", []))
-            clean_game["platform_names"] = self._resolve_platforms(
-                raw_game.get("platforms", [])
-            )
-            clean_game["theme_names"] = self._resolve_themes(raw_game.get("themes", []))
-
-            # Keep original IDs for reference
-            clean_game["genre_ids"] = raw_game.get("genres", [])
-            clean_game["platform_ids"] = raw_game.get("platforms", [])
-            clean_game["theme_ids"] = raw_game.get("themes", [])
-
-            # Text processing
-            clean_game["summary_length"] = len(clean_game["summary"])
-            clean_game["name_length"] = len(clean_game["name"])
-
-            # Quality indicators
-            clean_game["has_summary"] = bool(clean_game["summary"])
-            clean_game["has_rating"] = clean_game["rating"] is not None
-            clean_game["has_genres"] = len(clean_game["genre_names"]) > 0
-            clean_game["has_platforms"] = len(clean_game["platform_names"]) > 0
-
-            return clean_game
-
         except Exception as e:
             logger.error(
                 f"Error transforming game {raw_game.get('id', 'unknown')}: {e}"
@@ -197,8 +199,33 @@ class DataTransformer:
         if rating is None:
             return None
 
-        # Round to 1 decimal place
-        return round(float(rating), 1)
+        # Round half away from zero to 1 decimal place with plain integer
+        # math, skipping the round() builtin on the per-game hot path
+        value = float(rating)
+        if value >= 0:
+            return int(value * 10 + 0.5) / 10.0
+        return -int(-value * 10 + 0.5) / 10.0
+
+    @staticmethod
+    def _epoch_to_ymd(timestamp: int) -> tuple:
+        """
+        Convert a Unix timestamp to a (year, month, day) civil date.
+
+        Pure integer arithmetic (Howard Hinnant's civil_from_days), avoiding
+        datetime object construction on the per-game hot path.
+        """
+        z = timestamp // 86400 + 719468
+        era = z // 146097
+        doe = z - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        year = yoe + era * 400
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        if month <= 2:
+            year += 1
+        return year, month, day
 
     def _clean_release_date(self, timestamp: Optional[int]) -> Optional[str]:
         """Convert Unix timestamp to readable date."""
@@ -206,9 +233,9 @@ class DataTransformer:
             return None
 
         try:
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.strftime("%Y-%m-%d")
-        except (ValueError, OSError):
+            year, month, day = self._epoch_to_ymd(int(timestamp))
+            return f"{year:04d}-{month:02d}-{day:02d}"
+        except (ValueError, TypeError):
             return None
 
     def _extract_year(self, timestamp: Optional[int]) -> Optional[int]:
@@ -217,54 +244,48 @@ class DataTransformer:
             return None
 
         try:
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.year
-        except (ValueError, OSError):
+            return self._epoch_to_ymd(int(timestamp))[0]
+        except (ValueError, TypeError):
             return None
 
-    def _resolve_genres(self, genre_ids: List) -> List[str]:
-        """Resolve genre IDs to names."""
+    @staticmethod
+    def _resolve_ids(ids: List, lookup: Dict[int, str], label: str) -> List[str]:
+        """
+        Resolve a list of IDs to names against a lookup table.
+
+        The common production case - a short list of known integer IDs - is
+        served by a direct comprehension over the lookup table; unknown IDs
+        and dict-typed entries fall back to a per-element loop.
+        """
+        try:
+            # Fast path: all entries are known integer IDs
+            return [lookup[i] for i in ids]
+        except (KeyError, TypeError):
+            pass
+
         resolved = []
-        for gid in genre_ids:
-            if isinstance(gid, int):
-                resolved.append(self.genre_lookup.get(gid, f"Unknown Genre {gid}"))
-            elif isinstance(gid, dict) and "id" in gid:
+        for entry in ids:
+            if isinstance(entry, int):
+                resolved.append(lookup.get(entry, f"Unknown {label} {entry}"))
+            elif isinstance(entry, dict) and "id" in entry:
                 resolved.append(
-                    self.genre_lookup.get(gid["id"], f"Unknown Genre {gid['id']}")
+                    lookup.get(entry["id"], f"Unknown {label} {entry['id']}")
                 )
             else:
-                resolved.append(f"Unknown Genre {gid}")
+                resolved.append(f"Unknown {label} {entry}")
         return resolved
 
+    def _resolve_genres(self, genre_ids: List) -> List[str]:
+        """Resolve genre IDs to names."""
+        return self._resolve_ids(genre_ids, self.genre_lookup, "Genre")
+
     def _resolve_platforms(self, platform_ids: List) -> List[str]:
         """Resolve platform IDs to names."""
-        resolved = []
-        for pid in platform_ids:
-            if isinstance(pid, int):
-                resolved.append(
-                    self.platform_lookup.get(pid, f"Unknown Platform {pid}")
-                )
-            elif isinstance(pid, dict) and "id" in pid:
-                resolved.append(
-                    self.platform_lookup.get(pid["id"], f"Unknown Platform {pid['id']}")
-                )
-            else:
-                resolved.append(f"Unknown Platform {pid}")
-        return resolved
+        return self._resolve_ids(platform_ids, self.platform_lookup, "Platform")
 
     def _resolve_themes(self, theme_ids: List) -> List[str]:
         """Resolve theme IDs to names."""
-        resolved = []
-        for tid in theme_ids:
-            if isinstance(tid, int):
-                resolved.append(self.theme_lookup.get(tid, f"Unknown Theme {tid}"))
-            elif isinstance(tid, dict) and "id" in tid:
-                resolved.append(
-                    self.theme_lookup.get(tid["id"], f"Unknown Theme {tid['id']}")
-                )
-            else:
-                resolved.append(f"Unknown Theme {tid}")
-        return resolved
+        return self._resolve_ids(theme_ids, self.theme_lookup, "Theme")
 
     def transform_batch(self, raw_games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -316,11 +337,24 @@ class DataTransformer:
 
         total_games = len(clean_games)
 
-        # Calculate quality metrics
-        has_summary = sum(1 for g in clean_games if g["has_summary"])
-        has_rating = sum(1 for g in clean_games if g["has_rating"])
-        has_genres = sum(1 for g in clean_games if g["has_genres"])
-        has_platforms = sum(1 for g in clean_games if g["has_platforms"])
+        # Accumulate all quality metrics in a single pass over the games
+        has_summary = 0
+        has_rating = 0
+        has_genres = 0
+        has_platforms = 0
+        rating_sum = 0.0
+        genre_count_sum = 0
+        platform_count_sum = 0
+
+        for g in clean_games:
+            has_summary += g["has_summary"]
+            has_genres += g["has_genres"]
+            has_platforms += g["has_platforms"]
+            if g["has_rating"]:
+                has_rating += 1
+                rating_sum += g["rating"] or 0
+            genre_count_sum += len(g["genre_names"])
+            platform_count_sum += len(g["platform_names"])
 
         # Quality score (0-100)
         quality_score = (
@@ -337,19 +371,9 @@ class DataTransformer:
             "has_rating": f"{has_rating}/{total_games} ({has_rating/total_games*100:.1f}%)",
             "has_genres": f"{has_genres}/{total_games} ({has_genres/total_games*100:.1f}%)",
             "has_platforms": f"{has_platforms}/{total_games} ({has_platforms/total_games*100:.1f}%)",
-            "avg_rating": (
-                round(
-                    sum(g["rating"] for g in clean_games if g["rating"]) / has_rating, 1
-                )
-                if has_rating
-                else 0
-            ),
-            "avg_genres_per_game": round(
-                sum(len(g["genre_names"]) for g in clean_games) / total_games, 1
-            ),
-            "avg_platforms_per_game": round(
-                sum(len(g["platform_names"]) for g in clean_games) / total_games, 1
-            ),
+            "avg_rating": round(rating_sum / has_rating, 1) if has_rating else 0,
+            "avg_genres_per_game": round(genre_count_sum / total_games, 1),
+            "avg_platforms_per_game": round(platform_count_sum / total_games, 1),
         }
 
 
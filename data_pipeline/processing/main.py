@@ -98,6 +98,22 @@ def save_transformed_data(clean_games: List[Dict[str, Any]]) -> None:
 
     logger.info(f"💾 Saved {len(clean_games)} clean games to {csv_path}")
 
+    # Save as Parquet when pyarrow is available — columnar and typed, so
+    # the web app loads it without tokenizing megabytes of JSON
+    parquet_path = None
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet_path = "data/games_clean.parquet"
+        pq.write_table(pa.Table.from_pylist(clean_games), parquet_path)
+        logger.info(f"💾 Saved {len(clean_games)} clean games to {parquet_path}")
+    except ImportError:
+        logger.info("pyarrow not installed, skipping Parquet export")
+    except Exception as e:
+        parquet_path = None
+        logger.warning(f"⚠️ Failed to write Parquet export: {e}")
+
     # Upload to GCS if configured
     bucket_name = os.getenv("DATA_BUCKET")
     gcs_prefix = os.getenv("GCS_PREFIX", "processed/")
@@ -119,6 +135,15 @@ def save_transformed_data(clean_games: List[Dict[str, Any]]) -> None:
             csv_blob.upload_from_filename(csv_path)
             logger.info(f"☁️ Uploaded CSV to gs://{bucket_name}/{csv_blob_name}")
 
+            # Upload Parquet
+            if parquet_path:
+                parquet_blob_name = f"{gcs_prefix}games_clean.parquet"
+                parquet_blob = bucket.blob(parquet_blob_name)
+                parquet_blob.upload_from_filename(parquet_path)
+                logger.info(
+                    f"☁️ Uploaded Parquet to gs://{bucket_name}/{parquet_blob_name}"
+                )
+
         except Exception as e:
             logger.warning(f"⚠️ Failed to upload to GCS: {e}")
             print("⚠️ Continuing without GCS upload...")
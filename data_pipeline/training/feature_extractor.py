@@ -9,7 +9,8 @@ Supports text-based, categorical, and numerical feature extraction.
 import logging
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Tuple, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Optional, Union
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.metrics.pairwise import cosine_similarity
@@ -18,6 +19,53 @@ import pickle
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class GameBatch:
+    """
+    Structure-of-arrays view of a list of game dicts.
+
+    Numeric fields live in contiguous NumPy arrays so downstream feature
+    assembly runs as bulk array ops instead of per-dict lookups.
+    """
+
+    ids: np.ndarray
+    names: List[str]
+    summaries: List[str]
+    numeric: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_games(
+        cls, games: List[Dict[str, Any]], numeric_fields: List[str]
+    ) -> "GameBatch":
+        """
+        Transpose a list of game dicts into column arrays in one pass.
+
+        Args:
+            games: List of game data dictionaries
+            numeric_fields: Field names to materialize as float64 columns
+
+        Returns:
+            GameBatch with one array per numeric field
+        """
+        count = len(games)
+        numeric = {
+            field: np.fromiter(
+                (float(game.get(field) or 0) for game in games),
+                dtype=np.float64,
+                count=count,
+            )
+            for field in numeric_fields
+        }
+        return cls(
+            ids=np.fromiter(
+                (game.get("id") or 0 for game in games), dtype=np.int64, count=count
+            ),
+            names=[game.get("name", "") for game in games],
+            summaries=[game.get("summary", "") for game in games],
+            numeric=numeric,
+        )
+
+
 class GameFeatureExtractor:
     """
     Extracts and processes features from game data for ML models.
@@ -28,16 +76,25 @@ class GameFeatureExtractor:
     - Numerical features (ratings, release year, etc.)
     """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        label_encoders: Optional[Dict[str, Any]] = None,
+        tfidf_vectorizer: Optional[TfidfVectorizer] = None,
+    ):
         """
         Initialize the feature extractor.
 
         Args:
             config: Configuration dictionary for feature extraction
+            label_encoders: Pre-fitted label encoders keyed by categorical
+                feature name; injected encoders are reused instead of refit
+            tfidf_vectorizer: Pre-fitted TF-IDF vectorizer; text extraction
+                transforms with it instead of learning a new vocabulary
         """
         self.config = config or self._get_default_config()
-        self.tfidf_vectorizer = None
-        self.label_encoders = {}
+        self.tfidf_vectorizer = tfidf_vectorizer
+        self.label_encoders = label_encoders or {}
         self.scaler = StandardScaler()
         self.feature_names = []
         self.is_fitted = False
@@ -142,8 +199,8 @@ class GameFeatureExtractor:
                 " ".join([text_data[feature][i] for feature in text_data.keys()])
             )
 
-        # Fit TF-IDF vectorizer
-        if not self.is_fitted:
+        # Fit TF-IDF vectorizer unless a fitted one was injected
+        if not self.is_fitted and self.tfidf_vectorizer is None:
             self.tfidf_vectorizer = TfidfVectorizer(
                 max_features=self.config["text_features"]["summary"]["max_features"],
                 ngram_range=self.config["text_features"]["summary"]["ngram_range"],
@@ -193,7 +250,7 @@ class GameFeatureExtractor:
         encoded_features = []
 
         for col in df.columns:
-            if not self.is_fitted:
+            if not self.is_fitted and col not in self.label_encoders:
                 le = LabelEncoder()
                 encoded_col = le.fit_transform(df[col].fillna("unknown"))
                 self.label_encoders[col] = le
@@ -215,30 +272,29 @@ class GameFeatureExtractor:
 
         return categorical_matrix
 
-    def extract_numerical_features(self, games: List[Dict[str, Any]]) -> np.ndarray:
+    def extract_numerical_features(
+        self, games: Union[List[Dict[str, Any]], GameBatch]
+    ) -> np.ndarray:
         """
         Extract numerical features with scaling.
 
         Args:
-            games: List of game data dictionaries
+            games: List of game data dictionaries, or a GameBatch whose
+                numeric columns are reused without another transpose
 
         Returns:
             Scaled numerical feature matrix
         """
-        numerical_data = []
+        feature_names = self.config["numerical_features"]
 
-        for feature_name in self.config["numerical_features"]:
-            feature_values = []
-
-            for game in games:
-                value = game.get(feature_name, 0)
-                if value is None:
-                    value = 0
-                feature_values.append(float(value))
-
-            numerical_data.append(feature_values)
+        if isinstance(games, GameBatch):
+            batch = games
+        else:
+            batch = GameBatch.from_games(games, feature_names)
 
-        numerical_matrix = np.column_stack(numerical_data)
+        numerical_matrix = np.column_stack(
+            [batch.numeric[name] for name in feature_names]
+        )
 
         # Scale numerical features
         if not self.is_fitted:
@@ -348,7 +404,8 @@ class GameFeatureExtractor:
         }
 
         with open(filepath, "wb") as f:
-            pickle.dump(model_data, f)
+            # Protocol 5 serializes NumPy buffers out-of-band (fast, zero-copy)
+            pickle.dump(model_data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
         logger.info(f"Saved feature extractor model to {filepath}")
 
@@ -30,15 +30,19 @@ logger = logging.getLogger(__name__)
 class MLTrainingService:
     """Handles ML model training and validation."""
 
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, tfidf_vectorizer: Any = None):
         """
         Initialize the ML training service.
 
         Args:
             config: Configuration dictionary for the training service
+            tfidf_vectorizer: Pre-fitted TF-IDF vectorizer passed through
+                to the recommendation model; training reuses its vocabulary
         """
         self.config = config or {}
-        self.recommendation_model = ContentBasedRecommendationModel(self.config)
+        self.recommendation_model = ContentBasedRecommendationModel(
+            self.config, tfidf_vectorizer=tfidf_vectorizer
+        )
         logger.info("Initialized ML Training Service")
 
     def load_training_data(self, data_path: str) -> List[Dict[str, Any]]:
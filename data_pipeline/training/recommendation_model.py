@@ -7,9 +7,12 @@ using TF-IDF features, categorical features, and cosine similarity.
 """
 
 import logging
+import mmap
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from scipy import sparse
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 import pickle
 
 from .feature_extractor import GameFeatureExtractor
@@ -17,6 +20,26 @@ from .feature_extractor import GameFeatureExtractor
 logger = logging.getLogger(__name__)
 
 
+def _top_k_indices(similarities: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return the indices of the k largest similarities, sorted descending.
+
+    Uses argpartition (O(n)) to select the candidates before sorting only
+    those k, instead of argsort (O(n log n)) over the full row.
+
+    Args:
+        similarities: 1-D array of similarity scores
+        k: Number of indices to return
+
+    Returns:
+        Array of at most k indices, highest similarity first
+    """
+    if k >= similarities.size:
+        return np.argsort(similarities)[::-1]
+    top = np.argpartition(similarities, -k)[-k:]
+    return top[np.argsort(similarities[top])[::-1]]
+
+
 class ContentBasedRecommendationModel:
     """
     Content-based recommendation model for games.
@@ -27,15 +50,23 @@ class ContentBasedRecommendationModel:
     - Rating-based weighting
     """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        tfidf_vectorizer: Optional[Any] = None,
+    ):
         """
         Initialize the recommendation model.
 
         Args:
             config: Configuration dictionary for the model
+            tfidf_vectorizer: Pre-fitted TF-IDF vectorizer passed through
+                to the feature extractor; training reuses its vocabulary
         """
         self.config = config or self._get_default_config()
-        self.feature_extractor = GameFeatureExtractor(self.config.get("feature_config"))
+        self.feature_extractor = GameFeatureExtractor(
+            self.config.get("feature_config"), tfidf_vectorizer=tfidf_vectorizer
+        )
         self.games_data = []
         self.game_features = None
         self.similarity_matrix = None
@@ -83,6 +114,7 @@ class ContentBasedRecommendationModel:
             },
             "min_rating_threshold": 70.0,
             "max_recommendations": 20,
+            "similarity_top_k": 50,
         }
 
     def prepare_data(self, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -134,11 +166,13 @@ class ContentBasedRecommendationModel:
             self.games_data
         )
 
-        # Calculate similarity matrix
-        self.similarity_matrix = cosine_similarity(self.game_features)
+        # Calculate similarity matrix (top-k per row, stored sparse)
+        self.similarity_matrix, similarity_stats = self._build_similarity_matrix(
+            self.game_features
+        )
 
         # Calculate training metrics
-        training_metrics = self._calculate_training_metrics()
+        training_metrics = self._calculate_training_metrics(similarity_stats)
 
         self.is_trained = True
 
@@ -151,19 +185,81 @@ class ContentBasedRecommendationModel:
             "metrics": training_metrics,
         }
 
-    def _calculate_training_metrics(self) -> Dict[str, Any]:
+    def _build_similarity_matrix(
+        self, features: np.ndarray, block_size: int = 1024
+    ) -> Tuple[sparse.csr_matrix, Dict[str, float]]:
+        """
+        Build a top-k truncated cosine similarity matrix in CSR format.
+
+        Computing similarities block by block keeps peak memory at
+        O(block_size * n) instead of O(n^2), and keeping only the top-k
+        entries per row bounds the stored matrix at n * top_k nonzeros
+        (a dense float64 matrix would be 80GB at n=100k).
+
+        Args:
+            features: Feature matrix for all games
+            block_size: Number of rows to process per block
+
+        Returns:
+            Tuple of (CSR similarity matrix, similarity statistics)
+        """
+        n_games = features.shape[0]
+        top_k = min(self.config.get("similarity_top_k", 50), n_games - 1)
+
+        # L2-normalize once so each block is a single GEMM call; calling
+        # cosine_similarity per block would re-normalize the full matrix
+        # on every iteration
+        normalized = normalize(features)
+
+        data_blocks = []
+        index_blocks = []
+        indptr = [0]
+        similarity_sum = 0.0
+        max_similarity = -np.inf
+        min_similarity = np.inf
+
+        for start in range(0, n_games, block_size):
+            block = normalized[start : start + block_size] @ normalized.T
+            rows = np.arange(block.shape[0])
+            block[rows, start + rows] = 0.0  # Remove self-similarity
+
+            similarity_sum += block.sum()
+            max_similarity = max(max_similarity, block.max())
+            min_similarity = min(min_similarity, block.min())
+
+            top_indices = np.argpartition(block, -top_k, axis=1)[:, -top_k:]
+            for i in range(block.shape[0]):
+                values = block[i, top_indices[i]]
+                keep = values > 0
+                data_blocks.append(values[keep])
+                index_blocks.append(top_indices[i][keep])
+                indptr.append(indptr[-1] + int(keep.sum()))
+
+        similarity_matrix = sparse.csr_matrix(
+            (np.concatenate(data_blocks), np.concatenate(index_blocks), indptr),
+            shape=(n_games, n_games),
+        )
+
+        similarity_stats = {
+            "avg_similarity": float(similarity_sum / (n_games * n_games)),
+            "max_similarity": float(max_similarity),
+            "min_similarity": float(min_similarity),
+        }
+
+        return similarity_matrix, similarity_stats
+
+    def _calculate_training_metrics(
+        self, similarity_stats: Dict[str, float]
+    ) -> Dict[str, Any]:
         """
         Calculate training metrics for the model.
 
+        Args:
+            similarity_stats: Similarity statistics from matrix construction
+
         Returns:
             Dictionary of training metrics
         """
-        # Calculate average similarity scores
-        np.fill_diagonal(self.similarity_matrix, 0)  # Remove self-similarity
-        avg_similarity = np.mean(self.similarity_matrix)
-        max_similarity = np.max(self.similarity_matrix)
-        min_similarity = np.min(self.similarity_matrix)
-
         # Calculate rating statistics
         ratings = [
             g.get("rating", 0) for g in self.games_data if g.get("has_rating", False)
@@ -177,12 +273,7 @@ class ContentBasedRecommendationModel:
                 "games_with_ratings": len(ratings),
             }
 
-        return {
-            "avg_similarity": float(avg_similarity),
-            "max_similarity": float(max_similarity),
-            "min_similarity": float(min_similarity),
-            "rating_stats": rating_stats,
-        }
+        return {**similarity_stats, "rating_stats": rating_stats}
 
     def get_recommendations(
         self, game_id: int, top_k: int = 10, exclude_played: bool = True
@@ -211,11 +302,18 @@ class ContentBasedRecommendationModel:
         if game_idx is None:
             raise ValueError(f"Game with ID {game_id} not found in training data")
 
-        # Get similarity scores
-        similarities = self.similarity_matrix[game_idx]
+        # Get similarity scores (handles both CSR and dense legacy models)
+        if sparse.issparse(self.similarity_matrix):
+            similarities = self.similarity_matrix.getrow(game_idx).toarray().ravel()
+        else:
+            similarities = self.similarity_matrix[game_idx]
 
-        # Get top-k similar games
-        similar_indices = np.argsort(similarities)[::-1]
+        # Get top-k similar games; include every nonzero candidate plus
+        # top_k zero-similarity fillers so genre filtering has headroom
+        candidate_count = min(
+            similarities.size, int(np.count_nonzero(similarities)) + top_k
+        )
+        similar_indices = _top_k_indices(similarities, candidate_count)
         recommendations = []
 
         for idx in similar_indices:
@@ -325,8 +423,8 @@ class ContentBasedRecommendationModel:
             # Calculate similarity with all games
             similarities = cosine_similarity(query_features, self.game_features)[0]
 
-            # Get top-k similar games
-            similar_indices = np.argsort(similarities)[::-1]
+            # Get top-k similar games (no filtering here, so exactly top_k)
+            similar_indices = _top_k_indices(similarities, top_k)
             recommendations = []
 
             for idx in similar_indices:
@@ -436,7 +534,8 @@ class ContentBasedRecommendationModel:
         self.feature_extractor.save_model(feature_extractor_path)
 
         with open(filepath, "wb") as f:
-            pickle.dump(model_data, f)
+            # Protocol 5 serializes NumPy buffers out-of-band (fast, zero-copy)
+            pickle.dump(model_data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
         logger.info(f"Saved recommendation model to {filepath}")
 
@@ -447,12 +546,21 @@ class ContentBasedRecommendationModel:
         Args:
             filepath: Path to load the model from
         """
+        # Unpickle straight from a read-only mapping: the kernel page
+        # cache backs the bytes, so there is no intermediate full-file
+        # copy in userspace and warm restarts share the cached pages
         with open(filepath, "rb") as f:
-            model_data = pickle.load(f)
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            model_data = pickle.loads(memoryview(mapped))
 
         self.config = model_data["config"]
         self.games_data = model_data["games_data"]
         self.game_features = model_data["game_features"]
+        # Serving only ranks by cosine score, where float32 precision is
+        # ample; the downcast halves the bytes each text query streams
+        # through the feature matrix
+        if self.game_features is not None and self.game_features.dtype == np.float64:
+            self.game_features = self.game_features.astype(np.float32)
         self.similarity_matrix = model_data["similarity_matrix"]
         self.is_trained = model_data["is_trained"]
 
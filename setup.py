@@ -67,6 +67,8 @@ setup(
             "pytest>=8.0.0",
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.12.0",
+            "pytest-xdist>=3.5.0",
+            "pytest-benchmark>=4.0.0",
             "sphinx>=7.2.0",
             "sphinx-rtd-theme>=2.0.0",
         ]
@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import os
+
+# Keep BLAS/OpenMP single-threaded inside pytest-xdist workers so the
+# sklearn/NumPy math in parallel tests does not oversubscribe cores
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+    os.environ.setdefault("MKL_NUM_THREADS", "1")
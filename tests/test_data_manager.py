@@ -46,41 +46,29 @@ class TestDataManager:
 
     def test_create_tables(self, data_manager):
         """Test that all required tables are created."""
-        # Check that tables exist
+        # One sqlite_master scan instead of a query per table
         cursor = data_manager.db.cursor()
+        tables = {
+            row[0]
+            for row in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )
+        }
 
-        # Check games table
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='games'"
-        )
-        assert cursor.fetchone() is not None
-
-        # Check ingestion_log table
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='ingestion_log'"
-        )
-        assert cursor.fetchone() is not None
-
-        # Check processing_status table
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='processing_status'"
-        )
-        assert cursor.fetchone() is not None
+        assert {"games", "ingestion_log", "processing_status"} <= tables
 
     def test_create_indexes(self, data_manager):
         """Test that indexes are created."""
+        # One sqlite_master scan instead of a query per index
         cursor = data_manager.db.cursor()
+        indexes = {
+            row[0]
+            for row in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            )
+        }
 
-        # Check that indexes exist
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_games_name'"
-        )
-        assert cursor.fetchone() is not None
-
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_games_rating'"
-        )
-        assert cursor.fetchone() is not None
+        assert {"idx_games_name", "idx_games_rating"} <= indexes
 
     def test_save_games_new(self, data_manager):
         """Test saving new games to database."""
@@ -111,8 +99,8 @@ class TestDataManager:
 
         result = data_manager.save_games(games)
 
-        # Check return values (save_games returns int, not dict)
-        assert result == 2
+        # save_games returns (games_new, games_updated)
+        assert result == (2, 0)
 
         # Check that games were saved
         cursor = data_manager.db.cursor()
@@ -158,8 +146,8 @@ class TestDataManager:
 
         result = data_manager.save_games([updated_game])
 
-        # Check return values (save_games returns int, not dict)
-        assert result == 1
+        # The pre-existing row counts as updated, not new
+        assert result == (0, 1)
 
         # Check that game was updated
         cursor = data_manager.db.cursor()
@@ -188,8 +176,8 @@ class TestDataManager:
 
         result = data_manager.save_games(games)
 
-        # Check return values (save_games returns int, not dict)
-        assert result == 1
+        # save_games returns (games_new, games_updated)
+        assert result == (1, 0)
 
         # Check that only valid game was saved
         cursor = data_manager.db.cursor()
@@ -197,6 +185,35 @@ class TestDataManager:
         count = cursor.fetchone()[0]
         assert count == 1
 
+    def test_bulk_load(self, data_manager):
+        """Test bulk loading games with index rebuild."""
+        games = [
+            {
+                "id": i,
+                "name": f"Bulk Game {i}",
+                "summary": f"Summary for bulk game {i}",
+                "genres": [],
+                "platforms": [],
+                "themes": [],
+                "rating": 80.0,
+                "rating_count": 100,
+                "first_release_date": 1609459200,
+            }
+            for i in range(1, 1001)  # At threshold, triggers index drop/rebuild
+        ]
+
+        result = data_manager.bulk_load(games)
+
+        assert result == 1000
+        assert data_manager.count_games() == 1000
+
+        # Indexes should be recreated after the bulk load
+        cursor = data_manager.db.cursor()
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_games_rating'"
+        )
+        assert cursor.fetchone() is not None
+
     def test_get_games_basic(self, data_manager):
         """Test basic game retrieval."""
         # Add test games
@@ -10,77 +10,394 @@ This module tests the complete ML pipeline including:
 """
 
 import pytest
+import copy
 import json
+import numpy as np
+from types import MappingProxyType
+from typing import List, NamedTuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The ML components pull in sklearn/scipy (several hundred ms of import
+# time), so they are imported lazily via class fixtures instead of at
+# module top; pytest collection stays fast for targeted runs
+class Game(NamedTuple):
+    """
+    Compact sample game record.
+
+    A NamedTuple stores each record as a bare pointer array instead of a
+    ~1 KB dict, and `_asdict()` recovers the dict form where the pipeline
+    requires one.
+    """
+
+    id: int
+    name: str
+    summary: str
+    rating: float
+    rating_count: int
+    release_year: int
+    summary_length: int
+    genre_names: List[str]
+    platform_names: List[str]
+    theme_names: List[str]
+    has_summary: bool = True
+    has_rating: bool = True
+    has_genres: bool = True
+    has_platforms: bool = True
+
+
+# Shared sample game data, built once per module; fixtures hand out dict
+# copies so tests cannot mutate the shared payload
+SAMPLE_GAMES = (
+    Game(
+        id=1,
+        name="Adventure Game",
+        summary="A great adventure game with puzzles and exploration",
+        rating=85.5,
+        rating_count=100,
+        release_year=2023,
+        summary_length=50,
+        genre_names=["Adventure", "Puzzle"],
+        platform_names=["PC", "PlayStation"],
+        theme_names=["Fantasy"],
+    ),
+    Game(
+        id=2,
+        name="Action Shooter",
+        summary="An action-packed shooter with multiplayer features",
+        rating=92.0,
+        rating_count=200,
+        release_year=2022,
+        summary_length=45,
+        genre_names=["Shooter", "Action"],
+        platform_names=["Xbox", "PC"],
+        theme_names=["Sci-Fi"],
+    ),
+    Game(
+        id=3,
+        name="Puzzle Adventure",
+        summary="A puzzle game with adventure elements",
+        rating=78.0,
+        rating_count=50,
+        release_year=2021,
+        summary_length=30,
+        genre_names=["Puzzle", "Adventure"],
+        platform_names=["Nintendo Switch"],
+        theme_names=["Mystery"],
+    ),
+    Game(
+        id=4,
+        name="Racing Game",
+        summary="Fast-paced racing with cars and tracks",
+        rating=88.0,
+        rating_count=150,
+        release_year=2023,
+        summary_length=35,
+        genre_names=["Racing"],
+        platform_names=["PC", "Xbox"],
+        theme_names=["Sports"],
+    ),
+    Game(
+        id=5,
+        name="Strategy Game",
+        summary="Complex strategy game with resource management",
+        rating=90.0,
+        rating_count=120,
+        release_year=2022,
+        summary_length=40,
+        genre_names=["Strategy"],
+        platform_names=["PC"],
+        theme_names=["War"],
+    ),
+    Game(
+        id=6,
+        name="RPG Adventure",
+        summary="Role-playing game with character development",
+        rating=87.0,
+        rating_count=180,
+        release_year=2023,
+        summary_length=45,
+        genre_names=["Role-playing (RPG)", "Adventure"],
+        platform_names=["PC", "PlayStation"],
+        theme_names=["Fantasy"],
+    ),
+    Game(
+        id=7,
+        name="Platform Game",
+        summary="Classic platformer with jumping and collecting",
+        rating=82.0,
+        rating_count=90,
+        release_year=2021,
+        summary_length=30,
+        genre_names=["Platform"],
+        platform_names=["Nintendo Switch"],
+        theme_names=["Action"],
+    ),
+    Game(
+        id=8,
+        name="Simulation Game",
+        summary="Life simulation with building and management",
+        rating=85.0,
+        rating_count=110,
+        release_year=2022,
+        summary_length=35,
+        genre_names=["Simulator"],
+        platform_names=["PC"],
+        theme_names=["Life"],
+    ),
+    Game(
+        id=9,
+        name="Fighting Game",
+        summary="Combat fighting game with special moves",
+        rating=89.0,
+        rating_count=95,
+        release_year=2023,
+        summary_length=32,
+        genre_names=["Fighting"],
+        platform_names=["PlayStation", "Xbox"],
+        theme_names=["Action"],
+    ),
+    Game(
+        id=10,
+        name="Indie Adventure",
+        summary="Independent adventure game with unique art style",
+        rating=84.0,
+        rating_count=75,
+        release_year=2021,
+        summary_length=38,
+        genre_names=["Indie", "Adventure"],
+        platform_names=["PC", "Nintendo Switch"],
+        theme_names=["Artistic"],
+    ),
+)
+
+
+# Test-friendly extractor config (min_df=1 so single-document terms survive),
+# defined once and treated as read-only; tests pass a shallow copy to the
+# extractor since the config ends up pickled with saved models
+TEST_CONFIG = MappingProxyType(
+    {
+        "text_features": {
+            "summary": {
+                "max_features": 100,
+                "ngram_range": (1, 1),
+                "min_df": 1,  # Allow single document terms
+                "max_df": 0.95,
+                "stop_words": "english",
+            },
+            "name": {
+                "max_features": 50,
+                "ngram_range": (1, 1),
+                "min_df": 1,
+                "max_df": 0.9,
+                "stop_words": "english",
+            },
+        },
+        "categorical_features": ["genre_names", "platform_names", "theme_names"],
+        "numerical_features": [
+            "rating",
+            "rating_count",
+            "release_year",
+            "summary_length",
+        ],
+        "target_feature": "rating",
+    }
+)
+
+
+@pytest.fixture
+def test_config():
+    """Shared extractor config for tests."""
+    return dict(TEST_CONFIG)
+
+
+# Numeric fields exposed by the SoA fixture, with compact dtypes
+NUMERIC_FIELDS = {
+    "rating": np.float32,
+    "rating_count": np.int32,
+    "release_year": np.int16,
+    "summary_length": np.int32,
+}
+
+
+@pytest.fixture
+def sample_games_soa(sample_games):
+    """Structure-of-arrays view of the sample games.
+
+    Exposes one contiguous array per numeric field plus parallel lists for
+    the categorical name fields, so numeric extraction tests can assert
+    against column vectors without per-dict lookups.
+    """
+    soa = {
+        field: np.array([game[field] for game in sample_games], dtype=dtype)
+        for field, dtype in NUMERIC_FIELDS.items()
+    }
+    soa["genre_names"] = [game["genre_names"] for game in sample_games]
+    soa["platform_names"] = [game["platform_names"] for game in sample_games]
+    soa["theme_names"] = [game["theme_names"] for game in sample_games]
+    return soa
+
+
+def make_synthetic_games(count):
+    """Build a deterministic synthetic catalog for scale-sensitive tests."""
+    genres = ["Adventure", "Shooter", "Puzzle", "Racing", "Strategy"]
+    themes = ["Fantasy", "Sci-Fi", "Mystery", "Sports", "War"]
+    return [
+        {
+            "id": i,
+            "name": f"Synthetic Game {i}",
+            "summary": f"A {genres[i % 5].lower()} game number {i} with "
+            f"{themes[i % 5].lower()} elements and unique mechanics",
+            "rating": 70.0 + (i % 30),
+            "rating_count": 50 + i,
+            "release_year": 2015 + (i % 10),
+            "summary_length": 60,
+            "genre_names": [genres[i % 5]],
+            "platform_names": ["PC"],
+            "theme_names": [themes[i % 5]],
+            "has_summary": True,
+            "has_rating": True,
+            "has_genres": True,
+            "has_platforms": True,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_games():
+    """Sample game data for testing."""
+    return [game._asdict() for game in SAMPLE_GAMES]
+
+
+@pytest.fixture(scope="module")
+def sample_games_file(tmp_path_factory, sample_games):
+    """Serialize the sample games to JSON once per module."""
+    games_file = tmp_path_factory.mktemp("ml_pipeline") / "test_games.json"
+    if ORJSON_AVAILABLE:
+        games_file.write_bytes(orjson.dumps(sample_games))
+    else:
+        with open(games_file, "w") as f:
+            json.dump(sample_games, f)
+    return str(games_file)
+
+
+@pytest.fixture(scope="module")
+def extractor_cls():
+    """Lazily imported GameFeatureExtractor class."""
+    from data_pipeline.training.feature_extractor import GameFeatureExtractor
+
+    return GameFeatureExtractor
+
+
+@pytest.fixture(scope="module")
+def model_cls():
+    """Lazily imported ContentBasedRecommendationModel class."""
+    from data_pipeline.training.recommendation_model import (
+        ContentBasedRecommendationModel,
+    )
+
+    return ContentBasedRecommendationModel
+
+
+@pytest.fixture(scope="module")
+def service_cls():
+    """Lazily imported MLTrainingService class."""
+    from data_pipeline.training.main import MLTrainingService
+
+    return MLTrainingService
+
+
+@pytest.fixture(scope="session")
+def cat_encodings():
+    """Categorical matrix and label encoders fitted once per session."""
+    from data_pipeline.training.feature_extractor import GameFeatureExtractor
+
+    extractor = GameFeatureExtractor()
+    matrix = extractor.extract_categorical_features(
+        [game._asdict() for game in SAMPLE_GAMES]
+    )
+    return matrix, extractor.label_encoders
+
+
+@pytest.fixture(scope="session")
+def fitted_tfidf():
+    """TF-IDF vectorizer fitted once on the sample corpus and shared."""
+    from data_pipeline.training.feature_extractor import GameFeatureExtractor
+
+    extractor = GameFeatureExtractor()
+    extractor.extract_text_features([game._asdict() for game in SAMPLE_GAMES])
+    return extractor.tfidf_vectorizer
+
 
-# Import our ML components
-from data_pipeline.training.feature_extractor import GameFeatureExtractor
-from data_pipeline.training.recommendation_model import ContentBasedRecommendationModel
-from data_pipeline.training.main import MLTrainingService
+@pytest.fixture(scope="session")
+def trained_model():
+    """Recommendation model trained once and shared by read-only tests.
+
+    The trained model is also persisted under .pytest_cache/ml keyed by
+    the training payload (and the trainer's source), so repeat runs skip
+    the TF-IDF fit and similarity build entirely.
+    """
+    from joblib import Memory
+    from data_pipeline.training.recommendation_model import (
+        ContentBasedRecommendationModel,
+    )
+
+    memory = Memory(location=".pytest_cache/ml", verbose=0)
+
+    @memory.cache
+    def _train(games):
+        model = ContentBasedRecommendationModel()
+        model.train(list(games))
+        return model
+
+    return _train([game._asdict() for game in SAMPLE_GAMES])
+
+
+@pytest.fixture(scope="session")
+def trained_service(fitted_tfidf):
+    """Training service with a trained model, shared by read-only tests.
+
+    The pre-fitted vectorizer is injected so training transforms the
+    corpus instead of learning the same vocabulary again.
+    """
+    from data_pipeline.training.main import MLTrainingService
+
+    service = MLTrainingService(tfidf_vectorizer=fitted_tfidf)
+    service.train_model([game._asdict() for game in SAMPLE_GAMES])
+    return service
 
 
 class TestGameFeatureExtractor:
     """Test the GameFeatureExtractor class."""
 
-    @pytest.fixture
-    def sample_games(self):
-        """Sample game data for testing."""
-        return [
-            {
-                "id": 1,
-                "name": "Test Game 1",
-                "summary": "A great adventure game with puzzles and exploration",
-                "rating": 85.5,
-                "rating_count": 100,
-                "release_year": 2023,
-                "summary_length": 50,
-                "genre_names": ["Adventure", "Puzzle"],
-                "platform_names": ["PC", "PlayStation"],
-                "theme_names": ["Fantasy"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 2,
-                "name": "Test Game 2",
-                "summary": "An action-packed shooter with multiplayer features",
-                "rating": 92.0,
-                "rating_count": 200,
-                "release_year": 2022,
-                "summary_length": 45,
-                "genre_names": ["Shooter", "Action"],
-                "platform_names": ["Xbox", "PC"],
-                "theme_names": ["Sci-Fi"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-        ]
-
-    def test_feature_extractor_initialization(self):
+    def test_feature_extractor_initialization(self, extractor_cls):
         """Test feature extractor initialization."""
-        extractor = GameFeatureExtractor()
+        extractor = extractor_cls()
         assert extractor.config is not None
         assert extractor.tfidf_vectorizer is None
         assert extractor.label_encoders == {}
         assert not extractor.is_fitted
 
-    def test_text_data_preparation(self, sample_games):
+    def test_text_data_preparation(self, extractor_cls, sample_games):
         """Test text data preparation."""
-        extractor = GameFeatureExtractor()
+        extractor = extractor_cls()
         text_data = extractor.prepare_text_data(sample_games)
 
         assert "summary" in text_data
         assert "name" in text_data
-        assert len(text_data["summary"]) == 2
-        assert len(text_data["name"]) == 2
+        assert len(text_data["summary"]) == len(sample_games)
+        assert len(text_data["name"]) == len(sample_games)
         assert "adventure" in text_data["summary"][0].lower()
 
-    def test_text_cleaning(self):
+    def test_text_cleaning(self, extractor_cls):
         """Test text cleaning functionality."""
-        extractor = GameFeatureExtractor()
+        extractor = extractor_cls()
 
         # Test basic cleaning
         dirty_text = "  This is a TEST   with   extra   spaces  "
@@ -91,42 +408,71 @@ class TestGameFeatureExtractor:
         assert extractor._clean_text("") == ""
         assert extractor._clean_text(None) == ""
 
-    def test_feature_extraction(self, sample_games):
+    def test_numerical_features_match_soa(
+        self, extractor_cls, sample_games, sample_games_soa
+    ):
+        """Numeric extraction agrees with the contiguous column arrays."""
+        extractor = extractor_cls()
+        numerical_matrix = extractor.extract_numerical_features(sample_games)
+
+        columns = np.column_stack(
+            [
+                sample_games_soa[field].astype(np.float64)
+                for field in extractor.config["numerical_features"]
+            ]
+        )
+        expected = (columns - columns.mean(axis=0)) / columns.std(axis=0)
+
+        assert numerical_matrix.shape == (len(sample_games), len(NUMERIC_FIELDS))
+        np.testing.assert_allclose(numerical_matrix, expected, atol=1e-6)
+
+    def test_numerical_features_accept_game_batch(self, extractor_cls, sample_games):
+        """A prebuilt GameBatch skips the transpose and gives the same matrix."""
+        from data_pipeline.training.feature_extractor import GameBatch
+
+        fields = extractor_cls().config["numerical_features"]
+        batch = GameBatch.from_games(sample_games, fields)
+        assert batch.ids[0] == sample_games[0]["id"]
+
+        from_dicts = extractor_cls().extract_numerical_features(sample_games)
+        from_batch = extractor_cls().extract_numerical_features(batch)
+        np.testing.assert_allclose(from_batch, from_dicts)
+
+    def test_injected_label_encoders_are_reused(
+        self, extractor_cls, sample_games, cat_encodings
+    ):
+        """Pre-fitted encoders skip the refit and give identical encodings."""
+        expected_matrix, encoders = cat_encodings
+
+        extractor = extractor_cls(label_encoders=dict(encoders))
+        matrix = extractor.extract_categorical_features(sample_games)
+
+        np.testing.assert_array_equal(matrix, expected_matrix)
+        # The injected encoder objects are reused, not replaced by a refit
+        for name, encoder in encoders.items():
+            assert extractor.label_encoders[name] is encoder
+
+    def test_injected_tfidf_vectorizer_is_reused(
+        self, extractor_cls, sample_games, fitted_tfidf
+    ):
+        """A pre-fitted vectorizer skips the refit and gives identical features."""
+        baseline = extractor_cls().extract_text_features(sample_games)
+
+        extractor = extractor_cls(tfidf_vectorizer=fitted_tfidf)
+        features = extractor.extract_text_features(sample_games)
+
+        assert extractor.tfidf_vectorizer is fitted_tfidf
+        np.testing.assert_allclose(features, baseline)
+
+    def test_feature_extraction(self, extractor_cls, sample_games, test_config):
         """Test complete feature extraction."""
-        # Use test-friendly config
-        config = {
-            "text_features": {
-                "summary": {
-                    "max_features": 100,
-                    "ngram_range": (1, 1),
-                    "min_df": 1,  # Allow single document terms
-                    "max_df": 0.95,
-                    "stop_words": "english",
-                },
-                "name": {
-                    "max_features": 50,
-                    "ngram_range": (1, 1),
-                    "min_df": 1,
-                    "max_df": 0.9,
-                    "stop_words": "english",
-                },
-            },
-            "categorical_features": ["genre_names", "platform_names", "theme_names"],
-            "numerical_features": [
-                "rating",
-                "rating_count",
-                "release_year",
-                "summary_length",
-            ],
-            "target_feature": "rating",
-        }
-        extractor = GameFeatureExtractor(config)
+        extractor = extractor_cls(test_config)
 
         # Extract all features
         features, feature_names = extractor.extract_all_features(sample_games)
 
         # Check feature matrix shape
-        assert features.shape[0] == 2  # 2 games
+        assert features.shape[0] == len(sample_games)
         assert features.shape[1] > 0  # Should have features
 
         # Check feature names
@@ -138,36 +484,25 @@ class TestGameFeatureExtractor:
         # Check that extractor is now fitted
         assert extractor.is_fitted
 
-    def test_model_save_load(self, sample_games, tmp_path):
+    @pytest.mark.benchmark
+    def test_extract_all_features_benchmark(self, extractor_cls, benchmark):
+        """Feature extraction on 1000 games stays within its time envelope."""
+        pytest.importorskip("pytest_benchmark")
+        games = make_synthetic_games(1000)
+
+        def extract():
+            return extractor_cls().extract_all_features(games)
+
+        features, _ = benchmark(extract)
+        assert features.shape[0] == len(games)
+        # A regression to per-document Python loops would blow well past
+        # this (stats are unavailable when xdist disables the benchmark)
+        if benchmark.stats is not None:
+            assert benchmark.stats.stats.median < 2.0
+
+    def test_model_save_load(self, extractor_cls, sample_games, test_config, tmp_path):
         """Test model saving and loading."""
-        # Use test-friendly config
-        config = {
-            "text_features": {
-                "summary": {
-                    "max_features": 100,
-                    "ngram_range": (1, 1),
-                    "min_df": 1,
-                    "max_df": 0.95,
-                    "stop_words": "english",
-                },
-                "name": {
-                    "max_features": 50,
-                    "ngram_range": (1, 1),
-                    "min_df": 1,
-                    "max_df": 0.9,
-                    "stop_words": "english",
-                },
-            },
-            "categorical_features": ["genre_names", "platform_names", "theme_names"],
-            "numerical_features": [
-                "rating",
-                "rating_count",
-                "release_year",
-                "summary_length",
-            ],
-            "target_feature": "rating",
-        }
-        extractor = GameFeatureExtractor(config)
+        extractor = extractor_cls(test_config)
         extractor.extract_all_features(sample_games)
 
         # Save model
@@ -176,7 +511,7 @@ class TestGameFeatureExtractor:
         assert model_path.exists()
 
         # Load model
-        new_extractor = GameFeatureExtractor()
+        new_extractor = extractor_cls()
         new_extractor.load_model(str(model_path))
 
         assert new_extractor.is_fitted
@@ -187,182 +522,16 @@ class TestGameFeatureExtractor:
 class TestContentBasedRecommendationModel:
     """Test the ContentBasedRecommendationModel class."""
 
-    @pytest.fixture
-    def sample_games(self):
-        """Sample game data for testing."""
-        return [
-            {
-                "id": 1,
-                "name": "Adventure Game",
-                "summary": "A great adventure game with puzzles and exploration",
-                "rating": 85.5,
-                "rating_count": 100,
-                "release_year": 2023,
-                "summary_length": 50,
-                "genre_names": ["Adventure", "Puzzle"],
-                "platform_names": ["PC", "PlayStation"],
-                "theme_names": ["Fantasy"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 2,
-                "name": "Action Shooter",
-                "summary": "An action-packed shooter with multiplayer features",
-                "rating": 92.0,
-                "rating_count": 200,
-                "release_year": 2022,
-                "summary_length": 45,
-                "genre_names": ["Shooter", "Action"],
-                "platform_names": ["Xbox", "PC"],
-                "theme_names": ["Sci-Fi"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 3,
-                "name": "Puzzle Adventure",
-                "summary": "A puzzle game with adventure elements",
-                "rating": 78.0,
-                "rating_count": 50,
-                "release_year": 2021,
-                "summary_length": 30,
-                "genre_names": ["Puzzle", "Adventure"],
-                "platform_names": ["Nintendo Switch"],
-                "theme_names": ["Mystery"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 4,
-                "name": "Racing Game",
-                "summary": "Fast-paced racing with cars and tracks",
-                "rating": 88.0,
-                "rating_count": 150,
-                "release_year": 2023,
-                "summary_length": 35,
-                "genre_names": ["Racing"],
-                "platform_names": ["PC", "Xbox"],
-                "theme_names": ["Sports"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 5,
-                "name": "Strategy Game",
-                "summary": "Complex strategy game with resource management",
-                "rating": 90.0,
-                "rating_count": 120,
-                "release_year": 2022,
-                "summary_length": 40,
-                "genre_names": ["Strategy"],
-                "platform_names": ["PC"],
-                "theme_names": ["War"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 6,
-                "name": "RPG Adventure",
-                "summary": "Role-playing game with character development",
-                "rating": 87.0,
-                "rating_count": 180,
-                "release_year": 2023,
-                "summary_length": 45,
-                "genre_names": ["Role-playing (RPG)", "Adventure"],
-                "platform_names": ["PC", "PlayStation"],
-                "theme_names": ["Fantasy"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 7,
-                "name": "Platform Game",
-                "summary": "Classic platformer with jumping and collecting",
-                "rating": 82.0,
-                "rating_count": 90,
-                "release_year": 2021,
-                "summary_length": 30,
-                "genre_names": ["Platform"],
-                "platform_names": ["Nintendo Switch"],
-                "theme_names": ["Action"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 8,
-                "name": "Simulation Game",
-                "summary": "Life simulation with building and management",
-                "rating": 85.0,
-                "rating_count": 110,
-                "release_year": 2022,
-                "summary_length": 35,
-                "genre_names": ["Simulator"],
-                "platform_names": ["PC"],
-                "theme_names": ["Life"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 9,
-                "name": "Fighting Game",
-                "summary": "Combat fighting game with special moves",
-                "rating": 89.0,
-                "rating_count": 95,
-                "release_year": 2023,
-                "summary_length": 32,
-                "genre_names": ["Fighting"],
-                "platform_names": ["PlayStation", "Xbox"],
-                "theme_names": ["Action"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 10,
-                "name": "Indie Adventure",
-                "summary": "Independent adventure game with unique art style",
-                "rating": 84.0,
-                "rating_count": 75,
-                "release_year": 2021,
-                "summary_length": 38,
-                "genre_names": ["Indie", "Adventure"],
-                "platform_names": ["PC", "Nintendo Switch"],
-                "theme_names": ["Artistic"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-        ]
-
-    def test_model_initialization(self):
+    def test_model_initialization(self, model_cls):
         """Test model initialization."""
-        model = ContentBasedRecommendationModel()
+        model = model_cls()
         assert model.config is not None
         assert model.feature_extractor is not None
         assert not model.is_trained
 
-    def test_data_preparation(self, sample_games):
+    def test_data_preparation(self, model_cls, sample_games):
         """Test data preparation."""
-        model = ContentBasedRecommendationModel()
+        model = model_cls()
         prepared_games = model.prepare_data(sample_games)
 
         # All games should pass the filter
@@ -381,9 +550,11 @@ class TestContentBasedRecommendationModel:
         filtered_games = model.prepare_data(incomplete_games)
         assert len(filtered_games) == 0  # Should filter out incomplete games
 
-    def test_model_training(self, sample_games):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("ml")
+    def test_model_training(self, model_cls, sample_games):
         """Test model training."""
-        model = ContentBasedRecommendationModel()
+        model = model_cls()
 
         training_results = model.train(sample_games)
 
@@ -395,51 +566,100 @@ class TestContentBasedRecommendationModel:
         # Check model state
         assert model.is_trained
         assert model.game_features is not None
-        assert model.similarity_matrix is not None
         assert len(model.games_data) == len(sample_games)
 
-    def test_get_recommendations(self, sample_games):
-        """Test getting recommendations."""
-        model = ContentBasedRecommendationModel()
-        model.train(sample_games)
-
-        # Get recommendations for first game
-        recommendations = model.get_recommendations(sample_games[0]["id"], top_k=2)
+        # Similarity matrix must stay top-k truncated CSR, not dense NxN
+        from scipy.sparse import issparse
+
+        assert issparse(model.similarity_matrix)
+        assert model.similarity_matrix.format == "csr"
+        top_k = model.config["similarity_top_k"]
+        assert model.similarity_matrix.nnz <= len(sample_games) * top_k
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("ml")
+    def test_similarity_matrix_memory_bound(self, model_cls):
+        """The stored similarity matrix stays small for larger catalogs."""
+        games = make_synthetic_games(1000)
+
+        model = model_cls()
+        model.train(games)
+
+        matrix = model.similarity_matrix
+        matrix_bytes = (
+            matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+        )
+        # Dense float64 would be 8MB at n=1000; the CSR top-k form must
+        # stay well under that
+        assert matrix_bytes < 2_000_000
+
+    def test_top_k_indices_matches_full_sort(self):
+        """The argpartition scoring helper agrees with a full sort."""
+        from data_pipeline.training.recommendation_model import _top_k_indices
+
+        rng = np.random.default_rng(42)
+        similarities = rng.random(10_000)
+
+        top = _top_k_indices(similarities, 10)
+        expected = np.argsort(similarities)[::-1][:10]
+        np.testing.assert_array_equal(top, expected)
+
+        # k >= n falls back to a full descending sort
+        small = rng.random(5)
+        np.testing.assert_array_equal(
+            _top_k_indices(small, 10), np.argsort(small)[::-1]
+        )
+
+    def test_top_k_indices_scoring_envelope(self):
+        """Selecting top-10 of a million scores stays O(n), not O(n log n)."""
+        import time
+
+        from data_pipeline.training.recommendation_model import _top_k_indices
+
+        rng = np.random.default_rng(7)
+        similarities = rng.random(1_000_000)
+
+        _top_k_indices(similarities, 10)  # Warm up
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            _top_k_indices(similarities, 10)
+            timings.append(time.perf_counter() - start)
+        assert min(timings) < 0.1
+
+    @pytest.mark.parametrize(
+        "mode,query",
+        [("by_id", 1), ("by_text", "adventure puzzle game")],
+        ids=["by_id", "by_text"],
+    )
+    def test_recommendations(self, trained_model, mode, query):
+        """Test both recommendation paths against the shared trained model."""
+        if mode == "by_id":
+            recommendations = trained_model.get_recommendations(query, top_k=2)
+            # Recommendations must not include the target game
+            assert all(rec["game_id"] != query for rec in recommendations)
+        else:
+            recommendations = trained_model.get_similar_games_by_text(query, top_k=2)
 
         assert len(recommendations) <= 2
         assert all("game_id" in rec for rec in recommendations)
         assert all("similarity_score" in rec for rec in recommendations)
         assert all("name" in rec for rec in recommendations)
 
-        # Check that recommendations don't include the target game
-        target_id = sample_games[0]["id"]
-        assert all(rec["game_id"] != target_id for rec in recommendations)
-
-    def test_text_recommendations(self, sample_games):
-        """Test text-based recommendations."""
-        model = ContentBasedRecommendationModel()
-        model.train(sample_games)
-
-        query = "adventure puzzle game"
-        recommendations = model.get_similar_games_by_text(query, top_k=2)
-
-        assert len(recommendations) <= 2
-        assert all("game_id" in rec for rec in recommendations)
-        assert all("similarity_score" in rec for rec in recommendations)
-        assert all("name" in rec for rec in recommendations)
-
-    def test_model_save_load(self, sample_games, tmp_path):
+    def test_model_save_load(self, model_cls, sample_games, trained_model, tmp_path):
         """Test model saving and loading."""
-        model = ContentBasedRecommendationModel()
-        model.train(sample_games)
-
         # Save model
         model_path = tmp_path / "test_model.pkl"
-        model.save_model(str(model_path))
+        trained_model.save_model(str(model_path))
         assert model_path.exists()
 
+        # Saved with pickle protocol 5 (out-of-band NumPy buffers),
+        # without accidental compression
+        with open(model_path, "rb") as f:
+            assert f.read(2) == b"\x80\x05"
+
         # Load model
-        new_model = ContentBasedRecommendationModel()
+        new_model = model_cls()
         new_model.load_model(str(model_path))
 
         assert new_model.is_trained
@@ -451,198 +671,24 @@ class TestContentBasedRecommendationModel:
 class TestMLTrainingService:
     """Test the MLTrainingService class."""
 
-    @pytest.fixture
-    def sample_games_file(self, tmp_path, sample_games):
-        """Create a temporary games file for testing."""
-        games_file = tmp_path / "test_games.json"
-        with open(games_file, "w") as f:
-            json.dump(sample_games, f)
-        return str(games_file)
-
-    @pytest.fixture
-    def sample_games(self):
-        """Sample game data for testing."""
-        return [
-            {
-                "id": 1,
-                "name": "Test Game 1",
-                "summary": "A great adventure game",
-                "rating": 85.5,
-                "rating_count": 100,
-                "release_year": 2023,
-                "summary_length": 20,
-                "genre_names": ["Adventure"],
-                "platform_names": ["PC"],
-                "theme_names": ["Fantasy"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 2,
-                "name": "Test Game 2",
-                "summary": "An action shooter game",
-                "rating": 92.0,
-                "rating_count": 200,
-                "release_year": 2022,
-                "summary_length": 18,
-                "genre_names": ["Shooter"],
-                "platform_names": ["Xbox"],
-                "theme_names": ["Sci-Fi"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 3,
-                "name": "Test Game 3",
-                "summary": "A puzzle game with challenges",
-                "rating": 78.0,
-                "rating_count": 50,
-                "release_year": 2021,
-                "summary_length": 25,
-                "genre_names": ["Puzzle"],
-                "platform_names": ["Nintendo Switch"],
-                "theme_names": ["Mystery"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 4,
-                "name": "Test Game 4",
-                "summary": "Fast racing with cars",
-                "rating": 88.0,
-                "rating_count": 150,
-                "release_year": 2023,
-                "summary_length": 20,
-                "genre_names": ["Racing"],
-                "platform_names": ["PC", "Xbox"],
-                "theme_names": ["Sports"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 5,
-                "name": "Test Game 5",
-                "summary": "Strategy game with management",
-                "rating": 90.0,
-                "rating_count": 120,
-                "release_year": 2022,
-                "summary_length": 30,
-                "genre_names": ["Strategy"],
-                "platform_names": ["PC"],
-                "theme_names": ["War"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 6,
-                "name": "Test Game 6",
-                "summary": "RPG with character development",
-                "rating": 87.0,
-                "rating_count": 180,
-                "release_year": 2023,
-                "summary_length": 28,
-                "genre_names": ["Role-playing (RPG)"],
-                "platform_names": ["PC", "PlayStation"],
-                "theme_names": ["Fantasy"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 7,
-                "name": "Test Game 7",
-                "summary": "Platformer with jumping",
-                "rating": 82.0,
-                "rating_count": 90,
-                "release_year": 2021,
-                "summary_length": 22,
-                "genre_names": ["Platform"],
-                "platform_names": ["Nintendo Switch"],
-                "theme_names": ["Action"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 8,
-                "name": "Test Game 8",
-                "summary": "Life simulation game",
-                "rating": 85.0,
-                "rating_count": 110,
-                "release_year": 2022,
-                "summary_length": 20,
-                "genre_names": ["Simulator"],
-                "platform_names": ["PC"],
-                "theme_names": ["Life"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 9,
-                "name": "Test Game 9",
-                "summary": "Fighting game with combat",
-                "rating": 89.0,
-                "rating_count": 95,
-                "release_year": 2023,
-                "summary_length": 24,
-                "genre_names": ["Fighting"],
-                "platform_names": ["PlayStation", "Xbox"],
-                "theme_names": ["Action"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 10,
-                "name": "Test Game 10",
-                "summary": "Indie adventure with art",
-                "rating": 84.0,
-                "rating_count": 75,
-                "release_year": 2021,
-                "summary_length": 26,
-                "genre_names": ["Indie", "Adventure"],
-                "platform_names": ["PC", "Nintendo Switch"],
-                "theme_names": ["Artistic"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-        ]
-
-    def test_service_initialization(self):
+    def test_service_initialization(self, service_cls):
         """Test service initialization."""
-        service = MLTrainingService()
+        service = service_cls()
         assert service.config is not None
         assert service.recommendation_model is not None
 
-    def test_load_training_data(self, sample_games_file):
+    def test_load_training_data(self, service_cls, sample_games_file):
         """Test loading training data."""
-        service = MLTrainingService()
+        service = service_cls()
         games = service.load_training_data(sample_games_file)
 
-        assert len(games) == 10  # Updated to match the fixture
+        assert len(games) == len(SAMPLE_GAMES)
         assert games[0]["id"] == 1
         assert games[1]["id"] == 2
 
-    def test_train_model(self, sample_games):
+    def test_train_model(self, service_cls, sample_games):
         """Test model training."""
-        service = MLTrainingService()
+        service = service_cls()
         training_results = service.train_model(sample_games)
 
         assert training_results["model_type"] == "content_based_recommendation"
@@ -650,30 +696,26 @@ class TestMLTrainingService:
         assert training_results["feature_count"] > 0
         assert "training_time_seconds" in training_results
 
-    def test_validate_model(self, sample_games):
+    def test_validate_model(self, trained_service):
         """Test model validation."""
-        service = MLTrainingService()
-        service.train_model(sample_games)
-
-        validation_results = service.validate_model()
+        validation_results = trained_service.validate_model()
 
         assert validation_results["model_type"] == "content_based_recommendation"
         assert validation_results["status"] == "completed"
         assert validation_results["recommendation_generation"] == "success"
 
-    def test_save_model(self, sample_games, tmp_path):
+    def test_save_model(self, trained_service, tmp_path):
         """Test model saving."""
-        service = MLTrainingService()
-        service.train_model(sample_games)
-
         model_path = tmp_path / "test_model.pkl"
-        service.save_model(str(model_path))
+        trained_service.save_model(str(model_path))
 
         assert model_path.exists()
 
-    def test_full_pipeline(self, sample_games_file, tmp_path):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("ml")
+    def test_full_pipeline(self, service_cls, sample_games_file, tmp_path):
         """Test the complete training pipeline."""
-        service = MLTrainingService()
+        service = service_cls()
         model_path = tmp_path / "test_model.pkl"
 
         # Run the complete pipeline
@@ -688,250 +730,80 @@ class TestAPIIntegration:
 
     def test_api_import(self):
         """Test that API can be imported without errors."""
-        try:
-            import sys
-            from pathlib import Path
-
-            sys.path.append(str(Path(__file__).parent.parent))
-            from web_app.api.main import app
-
-            assert app is not None
-        except ImportError as e:
-            pytest.skip(f"API not available: {e}")
-
-    def test_pydantic_models(self):
-        """Test Pydantic models."""
-        try:
-            import sys
-            from pathlib import Path
-
-            sys.path.append(str(Path(__file__).parent.parent))
-            from web_app.api.main import (
-                GameRecommendation,
-                GameInfo,
-                TextRecommendationRequest,
-            )
-
-            # Test GameRecommendation
-            rec = GameRecommendation(
-                game_id=1,
-                name="Test Game",
-                similarity_score=0.95,
-                rating=None,  # Test optional rating
-                genres=["Adventure"],
-                platforms=["PC"],
-                summary="Test summary",
-            )
-            assert rec.game_id == 1
-            assert rec.rating is None
-
-            # Test GameInfo
-            info = GameInfo(
-                id=1,
-                name="Test Game",
-                summary="Test summary",
-                rating=None,
-                rating_count=0,
-                release_date="2023-01-01",
-                release_year=2023,
-                genre_names=["Adventure"],
-                platform_names=["PC"],
-                theme_names=["Fantasy"],
-            )
-            assert info.id == 1
-
-            # Test TextRecommendationRequest
-            req = TextRecommendationRequest(query="test query", top_k=5)
-            assert req.query == "test query"
-            assert req.top_k == 5
-
-        except ImportError as e:
-            pytest.skip(f"API not available: {e}")
-
-
-# Integration tests
-class TestMLPipelineIntegration:
-    """Integration tests for the complete ML pipeline."""
-
-    def test_end_to_end_pipeline(self, tmp_path):
-        """Test the complete end-to-end ML pipeline."""
-        # Create sample data (need at least 10 games)
-        sample_games = [
+        api_main = pytest.importorskip(
+            "web_app.api.main", reason="API not available"
+        )
+        assert api_main.app is not None
+
+    # One validation case per API model: (model name, kwargs, expected fields)
+    PYDANTIC_MODEL_CASES = [
+        (
+            "GameRecommendation",
+            {
+                "game_id": 1,
+                "name": "Test Game",
+                "similarity_score": 0.95,
+                "rating": None,  # Test optional rating
+                "genres": ["Adventure"],
+                "platforms": ["PC"],
+                "summary": "Test summary",
+            },
+            {"game_id": 1, "rating": None},
+        ),
+        (
+            "GameInfo",
             {
                 "id": 1,
-                "name": "Adventure Quest",
-                "summary": "An epic adventure game with puzzles and exploration",
-                "rating": 88.5,
-                "rating_count": 150,
-                "release_year": 2023,
-                "summary_length": 50,
-                "genre_names": ["Adventure", "Puzzle"],
-                "platform_names": ["PC", "PlayStation"],
-                "theme_names": ["Fantasy"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 2,
-                "name": "Space Shooter",
-                "summary": "A fast-paced space shooter with multiplayer battles",
-                "rating": 91.0,
-                "rating_count": 200,
-                "release_year": 2022,
-                "summary_length": 45,
-                "genre_names": ["Shooter", "Action"],
-                "platform_names": ["Xbox", "PC"],
-                "theme_names": ["Sci-Fi"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 3,
-                "name": "Puzzle Master",
-                "summary": "A challenging puzzle game with brain-teasing levels",
-                "rating": 79.0,
-                "rating_count": 75,
-                "release_year": 2021,
-                "summary_length": 40,
-                "genre_names": ["Puzzle"],
-                "platform_names": ["Nintendo Switch"],
-                "theme_names": ["Mystery"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 4,
-                "name": "Racing Champion",
-                "summary": "Fast racing with cars and tracks",
-                "rating": 88.0,
-                "rating_count": 150,
+                "name": "Test Game",
+                "summary": "Test summary",
+                "rating": None,
+                "rating_count": 0,
+                "release_date": "2023-01-01",
                 "release_year": 2023,
-                "summary_length": 35,
-                "genre_names": ["Racing"],
-                "platform_names": ["PC", "Xbox"],
-                "theme_names": ["Sports"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 5,
-                "name": "Strategy Master",
-                "summary": "Complex strategy game with resource management",
-                "rating": 90.0,
-                "rating_count": 120,
-                "release_year": 2022,
-                "summary_length": 40,
-                "genre_names": ["Strategy"],
+                "genre_names": ["Adventure"],
                 "platform_names": ["PC"],
-                "theme_names": ["War"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 6,
-                "name": "RPG Legend",
-                "summary": "Role-playing game with character development",
-                "rating": 87.0,
-                "rating_count": 180,
-                "release_year": 2023,
-                "summary_length": 45,
-                "genre_names": ["Role-playing (RPG)", "Adventure"],
-                "platform_names": ["PC", "PlayStation"],
                 "theme_names": ["Fantasy"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 7,
-                "name": "Platform Hero",
-                "summary": "Classic platformer with jumping and collecting",
-                "rating": 82.0,
-                "rating_count": 90,
-                "release_year": 2021,
-                "summary_length": 30,
-                "genre_names": ["Platform"],
-                "platform_names": ["Nintendo Switch"],
-                "theme_names": ["Action"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 8,
-                "name": "Life Simulator",
-                "summary": "Life simulation with building and management",
-                "rating": 85.0,
-                "rating_count": 110,
-                "release_year": 2022,
-                "summary_length": 35,
-                "genre_names": ["Simulator"],
-                "platform_names": ["PC"],
-                "theme_names": ["Life"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-            {
-                "id": 9,
-                "name": "Fighting Champion",
-                "summary": "Combat fighting game with special moves",
-                "rating": 89.0,
-                "rating_count": 95,
-                "release_year": 2023,
-                "summary_length": 32,
-                "genre_names": ["Fighting"],
-                "platform_names": ["PlayStation", "Xbox"],
-                "theme_names": ["Action"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
             },
-            {
-                "id": 10,
-                "name": "Indie Adventure",
-                "summary": "Independent adventure game with unique art style",
-                "rating": 84.0,
-                "rating_count": 75,
-                "release_year": 2021,
-                "summary_length": 38,
-                "genre_names": ["Indie", "Adventure"],
-                "platform_names": ["PC", "Nintendo Switch"],
-                "theme_names": ["Artistic"],
-                "has_summary": True,
-                "has_rating": True,
-                "has_genres": True,
-                "has_platforms": True,
-            },
-        ]
+            {"id": 1},
+        ),
+        (
+            "TextRecommendationRequest",
+            {"query": "test query", "top_k": 5},
+            {"query": "test query", "top_k": 5},
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        "model_name,kwargs,expected",
+        PYDANTIC_MODEL_CASES,
+        ids=[case[0] for case in PYDANTIC_MODEL_CASES],
+    )
+    def test_pydantic_models(self, model_name, kwargs, expected):
+        """Test Pydantic model validation, one case per model."""
+        api_main = pytest.importorskip(
+            "web_app.api.main", reason="API not available"
+        )
+        model_cls = getattr(api_main, model_name)
+
+        instance = model_cls(**kwargs)
+        for field, value in expected.items():
+            assert getattr(instance, field) == value
 
-        # Save sample data
-        games_file = tmp_path / "test_games.json"
-        with open(games_file, "w") as f:
-            json.dump(sample_games, f)
 
+# Integration tests
+class TestMLPipelineIntegration:
+    """Integration tests for the complete ML pipeline."""
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("ml")
+    def test_train_and_recommend(self, service_cls, sample_games):
+        """Train and exercise both recommendation paths without disk I/O."""
         # Train model
-        service = MLTrainingService()
+        service = service_cls()
         training_results = service.train_model(sample_games)
 
         # Validate training
-        assert (
-            training_results["training_samples"] == 10
-        )  # Updated to match sample data
+        assert training_results["training_samples"] == len(sample_games)
         assert training_results["feature_count"] > 0
         assert training_results["model_type"] == "content_based_recommendation"
 
@@ -944,13 +816,21 @@ class TestMLPipelineIntegration:
         text_recs = model.get_similar_games_by_text("adventure puzzle", top_k=2)
         assert len(text_recs) <= 2
 
-        # Save and load model
+        # An in-memory clone stands in for the pickle round-trip; the
+        # on-disk path is covered once by test_save_load_roundtrip
+        cloned = copy.deepcopy(model)
+        assert cloned.is_trained
+        assert len(cloned.get_recommendations(1, top_k=1)) >= 0
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("ml")
+    def test_save_load_roundtrip(self, service_cls, trained_service, tmp_path):
+        """Saving and reloading the trained model preserves its state."""
         model_path = tmp_path / "test_model.pkl"
-        service.save_model(str(model_path))
+        trained_service.save_model(str(model_path))
         assert model_path.exists()
 
-        # Load and test
-        new_service = MLTrainingService()
+        new_service = service_cls()
         new_service.recommendation_model.load_model(str(model_path))
         assert new_service.recommendation_model.is_trained
 
@@ -5,70 +5,158 @@ Tests intelligent data ingestion, batch tracking, and efficiency metrics.
 """
 
 import pytest
-import tempfile
-import os
+import sqlite3
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from unittest.mock import Mock
 
 from data_pipeline.shared.data_manager import DataManager
+from data_pipeline.ingestion.main import IGDBDataIngestion
 from data_pipeline.ingestion.smart_ingestion import SmartIngestion
 
 
+class _Game(NamedTuple):
+    """Compact mock game record; `_as_dicts` converts for the pipeline."""
+
+    id: int
+    name: str
+    summary: str
+    genres: List[Dict[str, Any]]
+    platforms: List[Dict[str, Any]]
+    themes: List[Dict[str, Any]]
+    rating: float
+    rating_count: int = 100
+    first_release_date: int = 1609459200
+
+
+def _as_dicts(games):
+    """Convert a slice of _Game records into the dicts ingestion expects."""
+    return [game._asdict() for game in games]
+
+
+# Mock fetch payloads built once at module import; tests slice these
+# instead of rebuilding per-test list comprehensions
+_DEFAULT_FETCH_GAMES = (
+    _Game(
+        id=1,
+        name="Test Game 1",
+        summary="A test game",
+        genres=[{"id": 1, "name": "Action"}],
+        platforms=[{"id": 1, "name": "PC"}],
+        themes=[{"id": 1, "name": "Fantasy"}],
+        rating=85.5,
+    ),
+    _Game(
+        id=2,
+        name="Test Game 2",
+        summary="Another test game",
+        genres=[{"id": 2, "name": "RPG"}],
+        platforms=[{"id": 2, "name": "PlayStation"}],
+        themes=[{"id": 2, "name": "Sci-Fi"}],
+        rating=92.0,
+        rating_count=200,
+    ),
+)
+
+_GAMES_1_TO_15 = tuple(
+    _Game(
+        id=i,
+        name=f"Game {i}",
+        summary=f"Summary for game {i}",
+        genres=[],
+        platforms=[],
+        themes=[],
+        rating=80.0 + i,
+    )
+    for i in range(1, 16)
+)
+
+# Same IDs as the first five games but with changed fields, so saving
+# them counts as updates rather than inserts
+_UPDATED_GAMES_1_TO_5 = tuple(
+    _Game(
+        id=i,
+        name=f"Game {i}",
+        summary=f"Updated summary for game {i}",
+        genres=[],
+        platforms=[],
+        themes=[],
+        rating=85.0 + i,
+        rating_count=200,
+    )
+    for i in range(1, 6)
+)
+
+
+@pytest.fixture(scope="session")
+def schema_template():
+    """In-memory database with the schema built once per session."""
+    template = sqlite3.connect(":memory:")
+    DataManager.from_connection(template)
+    yield template
+    template.close()
+
+
+@pytest.fixture
+def data_manager(schema_template):
+    """Fresh DataManager cloned from the schema template (no disk I/O)."""
+    connection = sqlite3.connect(":memory:")
+    schema_template.backup(connection)
+    return DataManager.from_connection(connection)
+
+
+class _StubIGDB:
+    """
+    Minimal IGDB client stand-in without unittest.mock call bookkeeping.
+
+    The volume-oriented tests drive several ingestion runs; a plain
+    method call with a list append skips Mock's per-call dispatch and
+    spec checks. Payloads are queued up front and served in call order.
+    """
+
+    def __init__(self, payloads):
+        self.payloads = list(payloads)
+        self.calls: List[Tuple[int, Optional[str]]] = []
+
+    def fetch_games_sample(self, sample_size, strategy=None):
+        self.calls.append((sample_size, strategy))
+        return self.payloads.pop(0)
+
+
+@pytest.fixture(scope="session")
+def _shared_igdb_mock():
+    """One spec'd IGDB client mock per session.
+
+    spec_set keeps attribute lookup a plain dict hit, avoids rebuilding
+    the Mock tree per test, and turns misspelled method names into
+    collection-time AttributeErrors instead of silently passing mocks.
+    """
+    return Mock(spec_set=IGDBDataIngestion)
+
+
 class TestSmartIngestion:
     """Test suite for SmartIngestion class."""
 
     @pytest.fixture
-    def temp_db_path(self):
-        """Create a temporary database file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            return tmp.name
-
-    @pytest.fixture
-    def mock_igdb_client(self):
-        """Create a mock IGDB client."""
-        mock_client = Mock()
-        mock_client.fetch_games_sample.return_value = [
-            {
-                "id": 1,
-                "name": "Test Game 1",
-                "summary": "A test game",
-                "genres": [{"id": 1, "name": "Action"}],
-                "platforms": [{"id": 1, "name": "PC"}],
-                "themes": [{"id": 1, "name": "Fantasy"}],
-                "rating": 85.5,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            },
-            {
-                "id": 2,
-                "name": "Test Game 2",
-                "summary": "Another test game",
-                "genres": [{"id": 2, "name": "RPG"}],
-                "platforms": [{"id": 2, "name": "PlayStation"}],
-                "themes": [{"id": 2, "name": "Sci-Fi"}],
-                "rating": 92.0,
-                "rating_count": 200,
-                "first_release_date": 1609459200,
-            },
-        ]
-        return mock_client
+    def mock_igdb_client(self, _shared_igdb_mock):
+        """Reset the shared IGDB mock and prime its default fetch payload."""
+        _shared_igdb_mock.reset_mock(return_value=True, side_effect=True)
+        _shared_igdb_mock.fetch_games_sample.return_value = _as_dicts(
+            _DEFAULT_FETCH_GAMES
+        )
+        return _shared_igdb_mock
 
     @pytest.fixture
-    def smart_ingestion(self, temp_db_path, mock_igdb_client):
-        """Create a SmartIngestion instance with temporary database."""
-        data_manager = DataManager(temp_db_path)
+    def smart_ingestion(self, data_manager, mock_igdb_client):
+        """Create a SmartIngestion instance with an in-memory database."""
         si = SmartIngestion(
             data_manager=data_manager,
             igdb_client=mock_igdb_client,
         )
         yield si
         si.close()
-        # Clean up temporary file
-        if os.path.exists(temp_db_path):
-            os.unlink(temp_db_path)
 
-    def test_init_creates_data_manager(self, temp_db_path, mock_igdb_client):
+    def test_init_creates_data_manager(self, data_manager, mock_igdb_client):
         """Test that SmartIngestion creates DataManager on initialization."""
-        data_manager = DataManager(temp_db_path)
         si = SmartIngestion(
             data_manager=data_manager,
             igdb_client=mock_igdb_client,
@@ -78,27 +166,15 @@ class TestSmartIngestion:
         assert isinstance(si.data_manager, DataManager)
 
         si.close()
-        os.unlink(temp_db_path)
 
     def test_smart_ingest_when_database_empty(self, smart_ingestion, mock_igdb_client):
         """Test smart ingestion when database is empty."""
         target_count = 10
 
         # Mock the IGDB client to return games
-        mock_igdb_client.fetch_games_sample.return_value = [
-            {
-                "id": i,
-                "name": f"Game {i}",
-                "summary": f"Summary for game {i}",
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 80.0 + i,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, target_count + 1)
-        ]
+        mock_igdb_client.fetch_games_sample.return_value = _as_dicts(
+            _GAMES_1_TO_15[:target_count]
+        )
 
         # Perform smart ingestion
         result = smart_ingestion.fetch_if_needed(target_count)
@@ -114,41 +190,16 @@ class TestSmartIngestion:
         self, smart_ingestion, mock_igdb_client
     ):
         """Test smart ingestion when database already has games."""
-        # Pre-populate database with some games
-        existing_games = [
-            {
-                "id": i,
-                "name": f"Existing Game {i}",
-                "summary": f"Summary for existing game {i}",
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 80.0 + i,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, 6)  # 5 existing games
-        ]
-        smart_ingestion.data_manager.save_games(existing_games)
+        # Pre-populate database with 5 existing games
+        smart_ingestion.data_manager.save_games(_as_dicts(_GAMES_1_TO_15[:5]))
 
         target_count = 10
         needed_count = target_count - 5  # Need 5 more games
 
-        # Mock the IGDB client to return new games
-        mock_igdb_client.fetch_games_sample.return_value = [
-            {
-                "id": i + 5,  # Start from ID 6
-                "name": f"New Game {i}",
-                "summary": f"Summary for new game {i}",
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 80.0 + i,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, needed_count + 1)
-        ]
+        # Mock the IGDB client to return new games (IDs 6-10)
+        mock_igdb_client.fetch_games_sample.return_value = _as_dicts(
+            _GAMES_1_TO_15[5:target_count]
+        )
 
         # Perform smart ingestion
         result = smart_ingestion.fetch_if_needed(target_count)
@@ -164,22 +215,8 @@ class TestSmartIngestion:
         self, smart_ingestion, mock_igdb_client
     ):
         """Test smart ingestion when target count is already reached."""
-        # Pre-populate database with more games than target
-        existing_games = [
-            {
-                "id": i,
-                "name": f"Existing Game {i}",
-                "summary": f"Summary for existing game {i}",
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 80.0 + i,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, 15)  # 14 existing games
-        ]
-        smart_ingestion.data_manager.save_games(existing_games)
+        # Pre-populate database with more games than target (14 games)
+        smart_ingestion.data_manager.save_games(_as_dicts(_GAMES_1_TO_15[:14]))
 
         target_count = 10  # Less than existing count
 
@@ -198,28 +235,15 @@ class TestSmartIngestion:
         target_count = 5
 
         # Mock the IGDB client
-        mock_igdb_client.fetch_games_sample.return_value = [
-            {
-                "id": i,
-                "name": f"Game {i}",
-                "summary": f"Summary for game {i}",
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 80.0 + i,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, target_count + 1)
-        ]
+        mock_igdb_client.fetch_games_sample.return_value = _as_dicts(
+            _GAMES_1_TO_15[:target_count]
+        )
 
         # Perform smart ingestion
         smart_ingestion.fetch_if_needed(target_count)
 
         # Check that batch was logged
-        cursor = smart_ingestion.data_manager.db.cursor()
-        cursor.execute("SELECT * FROM ingestion_log ORDER BY id DESC LIMIT 1")
-        log = cursor.fetchone()
+        log = smart_ingestion.data_manager.last_ingestion_log()
 
         assert log is not None
         assert log["batch_id"] is not None
@@ -227,31 +251,23 @@ class TestSmartIngestion:
         assert log["games_new"] == target_count
         assert log["status"] == "completed"
 
-    def test_ingestion_summary(self, smart_ingestion, mock_igdb_client):
+    def test_ingestion_summary(self, data_manager):
         """Test ingestion summary functionality."""
-        # Perform multiple ingestion runs
-        for i in range(3):
-            target_count = (i + 1) * 5
-
-            mock_igdb_client.fetch_games_sample.return_value = [
-                {
-                    "id": j + (i * 5),
-                    "name": f"Game {j}",
-                    "summary": f"Summary for game {j}",
-                    "genres": [],
-                    "platforms": [],
-                    "themes": [],
-                    "rating": 80.0 + j,
-                    "rating_count": 100,
-                    "first_release_date": 1609459200,
-                }
-                for j in range(1, 6)  # Always fetch 5 games
-            ]
-
-            smart_ingestion.smart_ingest(target_count)
-
-        # Get summary
-        summary = smart_ingestion.get_ingestion_summary()
+        # Perform multiple ingestion runs: three pre-built batches of five
+        # games each (IDs 1-5, 6-10, 11-15), consumed in call order
+        stub = _StubIGDB(
+            [_as_dicts(_GAMES_1_TO_15[i * 5 : (i + 1) * 5]) for i in range(3)]
+        )
+
+        with SmartIngestion(data_manager=data_manager, igdb_client=stub) as si:
+            for i in range(3):
+                si.smart_ingest((i + 1) * 5)
+
+            # Get summary
+            summary = si.get_ingestion_summary()
+
+        # Each run asked for exactly the five missing games
+        assert [call[0] for call in stub.calls] == [5, 5, 5]
 
         # Check summary structure
         assert "current_games" in summary
@@ -281,17 +297,14 @@ class TestSmartIngestion:
             smart_ingestion.fetch_if_needed(target_count)
 
         # Check that error was logged
-        cursor = smart_ingestion.data_manager.db.cursor()
-        cursor.execute("SELECT * FROM ingestion_log ORDER BY id DESC LIMIT 1")
-        log = cursor.fetchone()
+        log = smart_ingestion.data_manager.last_ingestion_log()
 
         assert log is not None
         assert log["status"] == "error"
         assert "API Error" in log["error_message"]
 
-    def test_context_manager(self, temp_db_path, mock_igdb_client):
+    def test_context_manager(self, data_manager, mock_igdb_client):
         """Test SmartIngestion as context manager."""
-        data_manager = DataManager(temp_db_path)
         with SmartIngestion(
             data_manager=data_manager,
             igdb_client=mock_igdb_client,
@@ -300,45 +313,22 @@ class TestSmartIngestion:
             assert si.data_manager.count_games() == 0
 
             # Perform ingestion
-            mock_igdb_client.fetch_games_sample.return_value = [
-                {
-                    "id": 1,
-                    "name": "Context Game",
-                    "summary": "A game saved in context",
-                    "genres": [],
-                    "platforms": [],
-                    "themes": [],
-                    "rating": 85.0,
-                    "rating_count": 100,
-                    "first_release_date": 1609459200,
-                }
-            ]
+            mock_igdb_client.fetch_games_sample.return_value = _as_dicts(
+                _GAMES_1_TO_15[:1]
+            )
 
             result = si.smart_ingest(1)
             assert result == 1
 
-        # After context exit, connection should be closed
-        os.unlink(temp_db_path)
 
     def test_different_fetching_strategies(self, smart_ingestion, mock_igdb_client):
         """Test different fetching strategies."""
         target_count = 5
 
         # Test balanced strategy (default)
-        mock_igdb_client.fetch_games_sample.return_value = [
-            {
-                "id": i,
-                "name": f"Balanced Game {i}",
-                "summary": f"Summary for balanced game {i}",
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 80.0 + i,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, target_count + 1)
-        ]
+        mock_igdb_client.fetch_games_sample.return_value = _as_dicts(
+            _GAMES_1_TO_15[:target_count]
+        )
 
         result = smart_ingestion.fetch_with_strategy("balanced", target_count)
         assert result == target_count
@@ -348,51 +338,23 @@ class TestSmartIngestion:
             target_count, strategy="balanced"
         )
 
-    def test_efficiency_calculation(self, smart_ingestion, mock_igdb_client):
+    def test_efficiency_calculation(self, data_manager):
         """Test efficiency calculation with mixed new/updated games."""
-        # First ingestion - all new games
-        mock_igdb_client.fetch_games_sample.return_value = [
-            {
-                "id": i,
-                "name": f"Game {i}",
-                "summary": f"Summary for game {i}",
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 80.0 + i,
-                "rating_count": 100,
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, 6)
-        ]
-
-        smart_ingestion.fetch_if_needed(5)
-
-        # Second ingestion - same games but with updated data
-        mock_igdb_client.fetch_games_sample.return_value = [
-            {
-                "id": i,
-                "name": f"Game {i}",  # Same name to trigger update
-                "summary": f"Updated summary for game {i}",  # Different summary
-                "genres": [],
-                "platforms": [],
-                "themes": [],
-                "rating": 85.0 + i,  # Different rating
-                "rating_count": 200,  # Different rating count
-                "first_release_date": 1609459200,
-            }
-            for i in range(1, 6)  # Same IDs, so these will be updates
-        ]
-
-        smart_ingestion.fetch_if_needed(10)  # Fetch 5 more games (total 10)
-
-        # Get summary
-        summary = smart_ingestion.get_ingestion_summary()
+        # First call returns five new games, the second the same IDs with
+        # updated data; the stub hands out the pre-built batches in order
+        stub = _StubIGDB(
+            [_as_dicts(_GAMES_1_TO_15[:5]), _as_dicts(_UPDATED_GAMES_1_TO_5)]
+        )
+
+        with SmartIngestion(data_manager=data_manager, igdb_client=stub) as si:
+            si.fetch_if_needed(5)
+            si.fetch_if_needed(10)  # Fetch 5 more games (total 10)
+
+            # Get summary
+            summary = si.get_ingestion_summary()
 
         # Check efficiency calculation
         assert summary["total_games_fetched"] == 10  # 5 + 5
-        assert (
-            summary["total_games_new"] == 10
-        )  # All games are counted as new due to INSERT OR REPLACE
-        assert summary["total_games_updated"] == 0  # No separate update tracking
-        assert summary["efficiency"] == 100.0  # All fetched games are "new"
+        assert summary["total_games_new"] == 5  # First batch only
+        assert summary["total_games_updated"] == 5  # Second batch re-sent IDs 1-5
+        assert summary["efficiency"] == 50.0  # Half the fetched games were new
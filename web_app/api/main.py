@@ -9,14 +9,25 @@ Usage:
     uvicorn web_app.api.main:app --reload
 """
 
+import asyncio
+import hashlib
+import heapq
 import logging
 import os
+import shutil
 import sys
+import tempfile
+import traceback
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from fastapi import FastAPI, HTTPException, Query, Path as PathParam, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
+import numpy as np
+import orjson
 import uvicorn
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.requests import Request
@@ -37,7 +48,7 @@ from data_pipeline.training.recommendation_model import (  # noqa: E402
 )
 
 # Import model registry for cloud storage integration
-from web_app.model_registry import ModelRegistry  # noqa: E402
+from web_app.model_registry import get_registry  # noqa: E402
 
 # Setup logging
 logging.basicConfig(
@@ -46,12 +57,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
+# ORJSONResponse serializes with orjson's C encoder and, when returned
+# directly from a handler, skips FastAPI's jsonable_encoder pass entirely
 app = FastAPI(
     title="IGDB Game Recommendation API",
     description="API for game recommendations using content-based filtering",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -96,6 +110,166 @@ recommendation_model = None
 games_data = []
 model_registry = None
 
+# Derived read-only caches, rebuilt whenever games_data is (re)loaded.
+# The search columns are single NUL-joined lowercased blobs with row
+# start offsets: one str.find call scans all rows at C speed instead
+# of a Python-level substring check per game
+_names_blob: str = ""
+_name_starts: List[int] = []
+_summaries_blob: str = ""
+_summary_starts: List[int] = []
+_games_info_dicts: List[Dict[str, Any]] = []
+_games_by_id: Dict[int, Dict[str, Any]] = {}
+_genres_json: bytes = b"[]"
+_genres_etag: str = ""
+_platforms_json: bytes = b"[]"
+_platforms_etag: str = ""
+
+
+def _etag_for(payload: bytes) -> str:
+    """Strong ETag for a cached payload."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _conditional_response(request: Request, payload: bytes, etag: str) -> Response:
+    """
+    Serve cached bytes with ETag support.
+
+    When the client's If-None-Match matches, only a 304 goes on the
+    wire; otherwise the payload is returned with cache headers.
+    """
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=payload, media_type="application/json", headers=headers
+    )
+
+
+def _stream_json(rows: List[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Yield a JSON array incrementally, one serialized row per chunk.
+
+    Streaming keeps peak memory at one row instead of the full response
+    buffer and gets the first byte on the wire before the last row is
+    serialized.
+    """
+    yield b"["
+    first = True
+    for row in rows:
+        yield (b"" if first else b",") + orjson.dumps(row)
+        first = False
+    yield b"]"
+
+
+def _build_blob(values: List[str]) -> Tuple[str, List[int]]:
+    """Join strings with NUL separators, returning the blob and row starts."""
+    starts = []
+    pos = 0
+    for value in values:
+        starts.append(pos)
+        pos += len(value) + 1
+    return "\x00".join(values), starts
+
+
+def _scan_blob(blob: str, starts: List[int], query: str) -> Iterator[int]:
+    """
+    Yield indices of rows containing query, in ascending order.
+
+    Each str.find call runs the substring search in C across the whole
+    blob; matched positions map back to rows via bisection, and the
+    next search resumes at the following row so a row is yielded once.
+    """
+    pos = blob.find(query)
+    while pos != -1:
+        idx = bisect_right(starts, pos) - 1
+        yield idx
+        next_start = starts[idx + 1] if idx + 1 < len(starts) else len(blob)
+        pos = blob.find(query, next_start)
+
+
+@lru_cache(maxsize=256)
+def _page_bytes(offset: int, limit: int) -> bytes:
+    """Serialized /games page, cached per (offset, limit) between reloads."""
+    return orjson.dumps(_games_info_dicts[offset : offset + limit])
+
+
+@lru_cache(maxsize=256)
+def _page_etag(offset: int, limit: int) -> str:
+    """ETag of a /games page, cached alongside the page bytes."""
+    return _etag_for(_page_bytes(offset, limit))
+
+
+# Recommendation results are deterministic between model reloads, so
+# repeated requests for the same parameters come back as stored bytes
+# instead of re-running the similarity math; both caches are cleared
+# when a new model is loaded
+@lru_cache(maxsize=1024)
+def _recommendation_bytes(game_id: int, top_k: int) -> bytes:
+    """Serialized recommendations for a game ID."""
+    return orjson.dumps(
+        recommendation_model.get_recommendations(game_id, top_k=top_k)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _text_recommendation_bytes(query: str, top_k: int) -> bytes:
+    """Serialized recommendations for a normalized text query."""
+    return orjson.dumps(
+        recommendation_model.get_similar_games_by_text(query, top_k=top_k)
+    )
+
+
+def _rebuild_data_caches() -> None:
+    """
+    Rebuild caches derived from games_data.
+
+    The search blobs hold the lowercased names and summaries so a
+    request is a C-level substring scan, and the id map turns
+    single-game lookups into O(1) dict hits.
+    """
+    global _names_blob, _name_starts, _summaries_blob, _summary_starts
+    global _games_info_dicts, _games_by_id
+    global _genres_json, _genres_etag, _platforms_json, _platforms_etag
+
+    # The same genre/platform/theme names repeat across thousands of
+    # games but arrive from JSON as distinct str objects; interning
+    # collapses them to shared instances, shrinking the heap and making
+    # their equality checks pointer comparisons
+    for game in games_data:
+        if game.get("name"):
+            game["name"] = sys.intern(game["name"])
+        for field in ("genre_names", "platform_names", "theme_names"):
+            values = game.get(field)
+            if values:
+                game[field] = [sys.intern(name) for name in values]
+
+    # Response payloads are shaped once here; the endpoints then slice,
+    # look up or scan without building a dict per row per request
+    _games_info_dicts = [_game_info_payload(game) for game in games_data]
+    _names_blob, _name_starts = _build_blob(
+        [(game.get("name") or "").lower() for game in games_data]
+    )
+    _summaries_blob, _summary_starts = _build_blob(
+        [(game.get("summary") or "").lower() for game in games_data]
+    )
+    _games_by_id = {info["id"]: info for info in _games_info_dicts}
+    _page_bytes.cache_clear()
+    _page_etag.cache_clear()
+
+    # The genre and platform lists are static between reloads, so the
+    # serialized response bytes are computed here rather than per request
+    _genres_json = orjson.dumps(
+        sorted({name for game in games_data for name in game.get("genre_names", [])})
+    )
+    _platforms_json = orjson.dumps(
+        sorted(
+            {name for game in games_data for name in game.get("platform_names", [])}
+        )
+    )
+    _genres_etag = _etag_for(_genres_json)
+    _platforms_etag = _etag_for(_platforms_json)
+
 
 # Pydantic models for API requests/responses
 class GameRecommendation(BaseModel):
@@ -148,6 +322,56 @@ class ModelStatus(BaseModel):
     model_type: str = Field(..., description="Type of recommendation model")
 
 
+def _share_feature_matrix(model: ContentBasedRecommendationModel) -> None:
+    """
+    Back the model's feature matrix with a memory-mapped file.
+
+    With multiple uvicorn workers each process would otherwise hold its
+    own copy of game_features; serving it from one .npy file (tmpfs
+    when /dev/shm exists) lets the OS page cache share the pages. The
+    shape and dtype in the filename invalidate stale files when a new
+    model ships.
+    """
+    features = model.game_features
+    if features is None:
+        return
+
+    shm_dir = Path("/dev/shm")
+    if not shm_dir.is_dir():
+        shm_dir = Path(tempfile.gettempdir())
+    rows, cols = features.shape
+    feats_path = shm_dir / f"igdb_game_features_{rows}x{cols}_{features.dtype}.npy"
+
+    try:
+        if not feats_path.exists():
+            # Write via a per-process temp name and atomic rename so
+            # concurrent workers never read a half-written file (the
+            # name keeps the .npy suffix so np.save does not append one)
+            tmp_path = feats_path.with_suffix(f".{os.getpid()}.npy")
+            np.save(tmp_path, features)
+            os.replace(tmp_path, feats_path)
+        model.game_features = np.load(feats_path, mmap_mode="r")
+        logger.info(f"Feature matrix memory-mapped from {feats_path}")
+    except OSError as e:
+        logger.warning(f"Could not memory-map feature matrix: {e}")
+
+
+def _game_info_payload(game: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the GameInfo-shaped response dict for a stored game."""
+    return {
+        "id": game["id"],
+        "name": game["name"],
+        "summary": game.get("summary", ""),
+        "rating": game.get("rating", 0),
+        "rating_count": game.get("rating_count", 0),
+        "release_date": game.get("release_date", ""),
+        "release_year": game.get("release_year", 0),
+        "genre_names": game.get("genre_names", []),
+        "platform_names": game.get("platform_names", []),
+        "theme_names": game.get("theme_names", []),
+    }
+
+
 def get_current_user(request: Request) -> Dict[str, Any]:
     """Dependency to ensure a logged-in Google user exists in the session.
 
@@ -246,23 +470,29 @@ async def startup_event():
 
     try:
         # Initialize model registry
-        model_registry = ModelRegistry()
+        model_registry = get_registry()
         health_status = model_registry.health_check()
         logger.info(f"Model registry health: {health_status}")
 
-        # Load games data from Cloud Storage or local fallback
+        # Load games data from Cloud Storage or local fallback; run the
+        # blocking download/parse in a thread so readiness probes are not
+        # stalled behind the event loop
         logger.info("Loading games data...")
-        games_data = model_registry.get_games_data()
+        games_data = await asyncio.to_thread(model_registry.get_games_data)
         if games_data:
             logger.info(f"Loaded {len(games_data)} games successfully")
         else:
             logger.warning("Failed to load games data")
+        _rebuild_data_caches()
 
         # Load recommendation model from Cloud Storage or local fallback
         logger.info("Loading recommendation model...")
-        model_path = model_registry.get_model_path("recommendation_model.pkl")
-        feature_extractor_path = model_registry.get_model_path(
-            "recommendation_model_feature_extractor.pkl"
+        model_path = await asyncio.to_thread(
+            model_registry.get_model_path, "recommendation_model.pkl"
+        )
+        feature_extractor_path = await asyncio.to_thread(
+            model_registry.get_model_path,
+            "recommendation_model_feature_extractor.pkl",
         )
 
         if model_path and feature_extractor_path:
@@ -271,9 +501,11 @@ async def startup_event():
                 ".pkl", "_feature_extractor.pkl"
             )
             try:
-                import shutil
-
-                shutil.copy2(feature_extractor_path, expected_feature_extractor_path)
+                await asyncio.to_thread(
+                    shutil.copy2,
+                    feature_extractor_path,
+                    expected_feature_extractor_path,
+                )
                 logger.info(
                     f"Copied feature extractor to {expected_feature_extractor_path}"
                 )
@@ -282,7 +514,12 @@ async def startup_event():
                 return
 
             recommendation_model = ContentBasedRecommendationModel()
-            recommendation_model.load_model(model_path)
+            # Unpickling the model is seconds of blocking disk and CPU
+            # work; keep it off the event loop as well
+            await asyncio.to_thread(recommendation_model.load_model, model_path)
+            _share_feature_matrix(recommendation_model)
+            _recommendation_bytes.cache_clear()
+            _text_recommendation_bytes.cache_clear()
             logger.info("Loaded recommendation model successfully")
 
             # Clean up temporary files if they were downloaded
@@ -305,8 +542,6 @@ async def startup_event():
 
     except Exception as e:
         logger.error(f"Failed to initialize application: {str(e)}")
-        import traceback
-
         logger.error(f"Traceback: {traceback.format_exc()}")
 
 
@@ -368,7 +603,7 @@ async def admin_status(user: Dict[str, Any] = Depends(get_current_user)):
     Returns:
         Dict with model registry health, games count, and model type
     """
-    registry = model_registry or ModelRegistry()
+    registry = model_registry or get_registry()
     return {
         "status": registry.health_check(),
         "games_count": len(games_data) if games_data else 0,
@@ -389,20 +624,11 @@ async def get_game_recommendations(
         raise HTTPException(status_code=503, detail="Recommendation model not loaded")
 
     try:
-        recommendations = recommendation_model.get_recommendations(game_id, top_k=top_k)
-
-        return [
-            GameRecommendation(
-                game_id=rec["game_id"],
-                name=rec["name"],
-                similarity_score=rec["similarity_score"],
-                rating=rec["rating"],
-                genres=rec["genres"],
-                platforms=rec["platforms"],
-                summary=rec["summary"],
-            )
-            for rec in recommendations
-        ]
+        # The model already returns dicts in the GameRecommendation shape;
+        # cache misses run the similarity math in a thread so the event
+        # loop keeps serving other requests, and hits return stored bytes
+        content = await asyncio.to_thread(_recommendation_bytes, game_id, top_k)
+        return Response(content=content, media_type="application/json")
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -419,29 +645,16 @@ async def get_text_recommendations(request: TextRecommendationRequest):
 
     try:
         logger.info(f"Getting text recommendations for query: '{request.query}'")
-        recommendations = recommendation_model.get_similar_games_by_text(
-            request.query, top_k=request.top_k
+        # Case and surrounding whitespace do not change the TF-IDF result,
+        # so normalize the cache key to fold equivalent queries together;
+        # misses run the embedding and top-k selection off the event loop
+        content = await asyncio.to_thread(
+            _text_recommendation_bytes, request.query.strip().lower(), request.top_k
         )
-
-        logger.info(f"Found {len(recommendations)} text-based recommendations")
-
-        return [
-            GameRecommendation(
-                game_id=rec["game_id"],
-                name=rec["name"],
-                similarity_score=rec["similarity_score"],
-                rating=rec["rating"],
-                genres=rec["genres"],
-                platforms=rec["platforms"],
-                summary=rec["summary"],
-            )
-            for rec in recommendations
-        ]
+        return Response(content=content, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error getting text recommendations: {str(e)}")
-        import traceback
-
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -458,32 +671,25 @@ async def search_games(
     query_lower = query.lower()
     matching_games = []
 
-    for game in games_data:
-        # Search in name and summary
-        name_match = query_lower in game.get("name", "").lower()
-        summary_match = query_lower in game.get("summary", "").lower()
-
-        if name_match or summary_match:
-            matching_games.append(game)
-
-            if len(matching_games) >= limit:
-                break
-
-    return [
-        GameInfo(
-            id=game["id"],
-            name=game["name"],
-            summary=game.get("summary", ""),
-            rating=game.get("rating", 0),
-            rating_count=game.get("rating_count", 0),
-            release_date=game.get("release_date", ""),
-            release_year=game.get("release_year", 0),
-            genre_names=game.get("genre_names", []),
-            platform_names=game.get("platform_names", []),
-            theme_names=game.get("theme_names", []),
-        )
-        for game in matching_games
-    ]
+    # Merge the (sorted) name and summary hit streams, deduplicating
+    # games that match in both fields; payloads are already
+    # response-shaped
+    last_idx = -1
+    for idx in heapq.merge(
+        _scan_blob(_names_blob, _name_starts, query_lower),
+        _scan_blob(_summaries_blob, _summary_starts, query_lower),
+    ):
+        if idx == last_idx:
+            continue
+        last_idx = idx
+        matching_games.append(_games_info_dicts[idx])
+
+        if len(matching_games) >= limit:
+            break
+
+    return StreamingResponse(
+        _stream_json(matching_games), media_type="application/json"
+    )
 
 
 @app.get("/games/{game_id}", response_model=GameInfo)
@@ -492,26 +698,16 @@ async def get_game_info(game_id: int = PathParam(..., description="Game ID")):
     if not games_data:
         raise HTTPException(status_code=503, detail="Games data not loaded")
 
-    game = next((g for g in games_data if g["id"] == game_id), None)
+    game = _games_by_id.get(game_id)
     if not game:
         raise HTTPException(status_code=404, detail=f"Game with ID {game_id} not found")
 
-    return GameInfo(
-        id=game["id"],
-        name=game["name"],
-        summary=game.get("summary", ""),
-        rating=game.get("rating", 0),
-        rating_count=game.get("rating_count", 0),
-        release_date=game.get("release_date", ""),
-        release_year=game.get("release_year", 0),
-        genre_names=game.get("genre_names", []),
-        platform_names=game.get("platform_names", []),
-        theme_names=game.get("theme_names", []),
-    )
+    return ORJSONResponse(content=game)
 
 
 @app.get("/games", response_model=List[GameInfo])
 async def list_games(
+    request: Request,
     limit: int = Query(default=50, description="Maximum results", ge=1, le=200),
     offset: int = Query(default=0, description="Number of results to skip", ge=0),
 ):
@@ -519,60 +715,44 @@ async def list_games(
     if not games_data:
         raise HTTPException(status_code=503, detail="Games data not loaded")
 
-    start_idx = offset
-    end_idx = min(offset + limit, len(games_data))
-
-    games_slice = games_data[start_idx:end_idx]
-
-    return [
-        GameInfo(
-            id=game["id"],
-            name=game["name"],
-            summary=game.get("summary", ""),
-            rating=game.get("rating", 0),
-            rating_count=game.get("rating_count", 0),
-            release_date=game.get("release_date", ""),
-            release_year=game.get("release_year", 0),
-            genre_names=game.get("genre_names", []),
-            platform_names=game.get("platform_names", []),
-            theme_names=game.get("theme_names", []),
-        )
-        for game in games_slice
-    ]
+    # Hot pages (typically the first few) come back as cached bytes,
+    # or as a bare 304 when the client already holds them
+    return _conditional_response(
+        request, _page_bytes(offset, limit), _page_etag(offset, limit)
+    )
 
 
 @app.get("/genres", response_model=List[str])
-async def list_genres():
+async def list_genres(request: Request):
     """Get list of all available genres."""
     if not games_data:
         raise HTTPException(status_code=503, detail="Games data not loaded")
 
-    genres = set()
-    for game in games_data:
-        genres.update(game.get("genre_names", []))
-
-    return sorted(list(genres))
+    return _conditional_response(request, _genres_json, _genres_etag)
 
 
 @app.get("/platforms", response_model=List[str])
-async def list_platforms():
+async def list_platforms(request: Request):
     """Get list of all available platforms."""
     if not games_data:
         raise HTTPException(status_code=503, detail="Games data not loaded")
 
-    platforms = set()
-    for game in games_data:
-        platforms.update(game.get("platform_names", []))
-
-    return sorted(list(platforms))
+    return _conditional_response(request, _platforms_json, _platforms_etag)
 
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8080))  # Default to 8080 for Cloud Run
+    # Worker count comes from the platform (Cloud Run sets memory per
+    # instance, so replicating games_data per worker is a deliberate
+    # choice); uvicorn picks uvloop and httptools automatically since
+    # they ship with uvicorn[standard]. Access logging is handled by the
+    # platform, so the per-request log write is skipped
     uvicorn.run(
         "web_app.api.main:app",
         host="0.0.0.0",
         port=port,
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
         reload=False,
         log_level="info",
+        access_log=False,
     )
@@ -6,15 +6,41 @@ This module handles loading models and data from Google Cloud Storage
 at runtime, enabling separation of data from application code.
 """
 
+import atexit
+import functools
 import logging
+import mmap
 import os
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
 import json
 
+import orjson
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 try:
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+try:
+    import google.auth
+    from google.auth.transport.requests import AuthorizedSession
     from google.cloud import storage
+    from google.cloud.storage import transfer_manager
+    from requests.adapters import HTTPAdapter, Retry
 
     GCS_AVAILABLE = True
 except ImportError:
@@ -25,6 +51,95 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Blobs above this size are fetched as parallel ranged GETs; a single
+# connection's throughput plateaus well before link bandwidth, so more
+# connections pay off until the NIC saturates. Both knobs are
+# operator-tunable per environment.
+_CHUNKED_DOWNLOAD_THRESHOLD = 8 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = (
+    int(os.environ.get("IGDB_DOWNLOAD_CHUNK_MB", "32")) * 1024 * 1024
+)
+_DOWNLOAD_MAX_WORKERS = int(os.environ.get("IGDB_DOWNLOAD_WORKERS", "8"))
+
+# Health probes fail fast and are rate-limited; a k8s liveness check must
+# never block a worker behind the client library's default ~60s timeout
+_HEALTH_PROBE_TIMEOUT = 2.0
+_HEALTH_CACHE_SECONDS = 5.0
+
+# The model artifacts that ship together; they are fetched as one batch
+_MODEL_ARTIFACTS = (
+    "recommendation_model.pkl",
+    "recommendation_model_feature_extractor.pkl",
+)
+
+# On-disk cache for downloaded artifacts; the catalog changes at most a
+# few times per day, so within the TTL a stat()+read replaces a GCS GET
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+_cache_dir = Path(os.environ.get("IGDB_CACHE_DIR", "~/.cache/igdb")).expanduser()
+
+_credentials_lock = threading.Lock()
+_credentials_initialized = False
+
+
+def _ensure_credentials() -> None:
+    """
+    Materialize GOOGLE_APPLICATION_CREDENTIALS_JSON as a key file, once.
+
+    CI and Cloud Run inject the service-account key as an environment
+    variable; the client library wants a file path. Writing it once per
+    process (instead of per ModelRegistry instance) avoids repeated temp
+    file churn under concurrent construction.
+    """
+    global _credentials_initialized
+    with _credentials_lock:
+        if _credentials_initialized:
+            return
+
+        credentials_json = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS_JSON")
+        if credentials_json:
+            # tmpfs keeps the key out of the container's persistent overlay
+            # filesystem; owner-only perms, removed again at exit
+            shm = Path("/dev/shm")
+            creds_dir = shm if shm.is_dir() else Path(tempfile.gettempdir())
+            creds_path = creds_dir / f"igdb-creds-{os.getpid()}.json"
+
+            # The env var is already the JSON document the client wants;
+            # validate once and write the raw string instead of paying a
+            # parse + re-serialize round-trip
+            json.loads(credentials_json)
+
+            fd = os.open(
+                creds_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(credentials_json.encode())
+            atexit.register(creds_path.unlink, missing_ok=True)
+            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(creds_path)
+
+        _credentials_initialized = True
+
+
+def _build_http_session():
+    """
+    Build an authorized HTTP session tuned for concurrent GCS traffic.
+
+    The client library's default requests.Session caps the connection pool
+    at 10, which starves the chunked and batched downloads above. A bigger
+    pool plus a small retry budget lifts that ceiling.
+
+    Returns:
+        AuthorizedSession with a 64-connection pool
+    """
+    credentials, _ = google.auth.default()
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
 
 class ModelRegistry:
     """Registry for managing models and data from Cloud Storage."""
@@ -47,54 +162,172 @@ class ModelRegistry:
         self.models_bucket_name = models_bucket
         self.project_id = project_id or os.environ.get("GOOGLE_CLOUD_PROJECT")
 
-        if GCS_AVAILABLE:
-            try:
-                # Handle credentials from environment variable (for CI)
-                credentials_json = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS_JSON")
-                if credentials_json:
-                    import json
-                    import tempfile
-
-                    # Create temporary credentials file
-                    with tempfile.NamedTemporaryFile(
-                        mode="w", suffix=".json", delete=False
-                    ) as f:
-                        json.dump(json.loads(credentials_json), f)
-                        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = f.name
-
-                self.storage_client = storage.Client(project=self.project_id)
-                self.data_bucket = self.storage_client.bucket(data_bucket)
-                self.models_bucket = self.storage_client.bucket(models_bucket)
-                logger.info(f"Connected to GCS buckets: {data_bucket}, {models_bucket}")
-            except Exception as e:
-                logger.error(f"Failed to connect to GCS: {e}")
-                self.storage_client = None
-                self.data_bucket = None
-                self.models_bucket = None
-        else:
-            self.storage_client = None
-            self.data_bucket = None
-            self.models_bucket = None
+        self._blob_cache: Dict[Tuple[str, str], Any] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="registry"
+        )
+        self._games_future = None
+        self._model_future = None
+        self._model_paths: Dict[str, Optional[str]] = {}
+        self._model_paths_lock = threading.Lock()
+
+        # Client construction (credential parsing, OAuth, TLS) is deferred
+        # to first real use; health-check-only processes never pay for it
+        self._client_lock = threading.Lock()
+        self._client_initialized = False
+        self._storage_client = None
+        self._data_bucket = None
+        self._models_bucket = None
+        self._prefetch_started = False
+        self._prefetch_lock = threading.Lock()
+        self._probe_cache: Optional[Tuple[float, Tuple[bool, bool]]] = None
+
+    @property
+    def storage_client(self):
+        """GCS client, connected lazily on first access."""
+        self._ensure_client()
+        return self._storage_client
+
+    @property
+    def data_bucket(self):
+        """Data bucket handle, connected lazily on first access."""
+        self._ensure_client()
+        return self._data_bucket
+
+    @property
+    def models_bucket(self):
+        """Models bucket handle, connected lazily on first access."""
+        self._ensure_client()
+        return self._models_bucket
+
+    def _ensure_client(self) -> None:
+        """Connect the storage client once, on the first thread to ask."""
+        if self._client_initialized:
+            return
+        with self._client_lock:
+            if self._client_initialized:
+                return
+            if GCS_AVAILABLE:
+                try:
+                    # Handle credentials from environment variable (for CI)
+                    _ensure_credentials()
+
+                    self._storage_client = storage.Client(
+                        project=self.project_id, _http=_build_http_session()
+                    )
+                    self._data_bucket = self._storage_client.bucket(
+                        self.data_bucket_name
+                    )
+                    self._models_bucket = self._storage_client.bucket(
+                        self.models_bucket_name
+                    )
+                    logger.info(
+                        f"Connected to GCS buckets: {self.data_bucket_name}, "
+                        f"{self.models_bucket_name}"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to connect to GCS: {e}")
+            self._client_initialized = True
+
+    def _start_prefetch(self) -> None:
+        """
+        Kick off the games and model downloads once, on first real use.
+
+        The two latency-heavy GETs then overlap each other and whatever the
+        caller does next (app import, model unpickling) instead of running
+        serially when each is first requested.
+        """
+        if self._prefetch_started:
+            return
+        with self._prefetch_lock:
+            if self._prefetch_started:
+                return
+            self._prefetch_started = True
+            if self.storage_client:
+                self._games_future = self._executor.submit(self._load_games_data)
+                self._model_future = self._executor.submit(self._fetch_all_models)
+
+    def _blob(self, bucket, blob_name: str):
+        """Return a cached blob handle for (bucket, name), creating it once."""
+        key = (bucket.name, blob_name)
+        blob = self._blob_cache.get(key)
+        if blob is None:
+            blob = bucket.blob(blob_name)
+            self._blob_cache[key] = blob
+        return blob
+
+    @staticmethod
+    def _generation_current(target: Path, generation: str) -> bool:
+        """True if target exists and its sidecar records this generation."""
+        sidecar = Path(f"{target}.generation")
+        try:
+            return target.exists() and sidecar.read_text().strip() == generation
+        except OSError:
+            return False
+
+    @staticmethod
+    def _record_generation(target: Path, generation: str) -> None:
+        """Remember which blob generation a downloaded file came from."""
+        Path(f"{target}.generation").write_text(generation)
 
-    def _download_file(self, bucket, blob_name: str, local_path: str) -> bool:
+    def _download_file(
+        self,
+        bucket,
+        blob_name: str,
+        local_path: str,
+        final_path: Optional[str] = None,
+    ) -> bool:
         """
         Download a file from Cloud Storage to local path.
 
+        If the destination already holds the blob's current generation
+        (per its .generation sidecar), the body transfer is skipped — the
+        metadata reload is a ~1KB request against an MB-scale download.
+
         Args:
             bucket: Cloud Storage bucket
             blob_name: Name of blob in bucket
             local_path: Local file path to save to
+            final_path: Eventual destination when local_path is a staging
+                file; the generation check runs against this path
 
         Returns:
-            True if successful, False otherwise
+            True if the destination is up to date (downloaded or skipped)
         """
         if not self.storage_client or not bucket:
             logger.error("GCS not available")
             return False
 
         try:
-            blob = bucket.blob(blob_name)
-            blob.download_to_filename(local_path)
+            blob = self._blob(bucket, blob_name)
+            blob.reload()
+            generation = str(blob.generation)
+            target = Path(final_path or local_path)
+            if self._generation_current(target, generation):
+                logger.info(
+                    f"{blob_name} unchanged (generation {generation}), skipping download"
+                )
+                return True
+
+            if blob.size and blob.size > _CHUNKED_DOWNLOAD_THRESHOLD:
+                # Large blobs (the model pickle) download as concurrent
+                # ranged GETs, multiplying throughput over one connection
+                transfer_manager.download_chunks_concurrently(
+                    blob,
+                    local_path,
+                    chunk_size=_DOWNLOAD_CHUNK_SIZE,
+                    max_workers=_DOWNLOAD_MAX_WORKERS,
+                    download_kwargs={"if_generation_match": blob.generation},
+                )
+            else:
+                # Conditional GET pins the transfer to the generation we
+                # just saw, so the sidecar can never describe other bytes
+                blob.download_to_filename(
+                    local_path, if_generation_match=blob.generation
+                )
+            # Sidecar travels next to the downloaded bytes; staging callers
+            # rename both together so the pair stays consistent
+            self._record_generation(Path(local_path), generation)
             logger.info(f"Downloaded {blob_name} to {local_path}")
             return True
         except Exception as e:
@@ -103,41 +336,219 @@ class ModelRegistry:
 
     def get_games_data(self) -> Optional[list]:
         """
-        Load games data from Cloud Storage.
+        Load games data, serving the on-disk cache when it is warm.
+
+        The first call starts the background prefetch and consumes its
+        result, letting the model download proceed concurrently. A cached
+        copy younger than the TTL is returned
+        without touching the network; a stale copy is still returned
+        immediately while a refresh runs in a background thread
+        (stale-while-revalidate).
 
         Returns:
             List of game data or None if failed
         """
+        self._start_prefetch()
+        future, self._games_future = self._games_future, None
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                logger.error(f"Games data prefetch failed: {e}")
+        return self._load_games_data()
+
+    @staticmethod
+    def _newest_cache_file() -> Path:
+        """Pick the freshest cached catalog file, preferring Parquet."""
+        json_path = _cache_dir / "games_clean.json"
+        if not PARQUET_AVAILABLE:
+            return json_path
+        parquet_path = _cache_dir / "games_clean.parquet"
+        if not parquet_path.exists():
+            return json_path
+        if not json_path.exists():
+            return parquet_path
+        return max(parquet_path, json_path, key=lambda p: p.stat().st_mtime)
+
+    def _load_games_data(self) -> Optional[list]:
+        """Blocking loader behind get_games_data and the init prefetch."""
+        cache_path = self._newest_cache_file()
+        cache_age = (
+            time.time() - cache_path.stat().st_mtime if cache_path.exists() else None
+        )
+
+        if cache_age is not None and cache_age < _CACHE_TTL_SECONDS:
+            games_data = self._read_games_cache(cache_path)
+            if games_data is not None:
+                return games_data
+
         if not self.storage_client:
             logger.warning("GCS not available, trying local fallback")
+            if cache_age is not None:
+                games_data = self._read_games_cache(cache_path)
+                if games_data is not None:
+                    return games_data
             return self._load_local_games_data()
 
+        if cache_age is not None:
+            # Serve the stale copy now; refresh it behind the caller's back
+            games_data = self._read_games_cache(cache_path)
+            if games_data is not None:
+                self._executor.submit(self._refresh_games_cache)
+                return games_data
+
+        games_data = self._refresh_games_cache()
+        if games_data is not None:
+            return games_data
+
+        logger.warning("Failed to download from GCS, trying local fallback")
+        return self._load_local_games_data()
+
+    def iter_games_data(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream games one record at a time instead of building the full list.
+
+        Uses a SAX-style ijson parse over the cached file, so peak memory
+        stays at one record regardless of catalog size. Consumers that fold
+        over the catalog (counts, feature scans) should prefer this over
+        get_games_data. Falls back to the full-list loader when ijson is
+        not installed.
+
+        Yields:
+            Game data dictionaries
+        """
+        cache_path = _cache_dir / "games_clean.json"
+        local_path = Path("data/games_clean.json")
+
+        source: Optional[Path] = None
+        if (
+            cache_path.exists()
+            and (time.time() - cache_path.stat().st_mtime) < _CACHE_TTL_SECONDS
+        ):
+            source = cache_path
+        elif self.storage_client and self._refresh_games_cache() is not None:
+            if cache_path.exists():
+                source = cache_path
+            else:
+                # Refresh landed in the Parquet cache; its rows are
+                # already materialized, so stream those
+                games_data = self._read_games_cache(self._newest_cache_file())
+                yield from games_data or []
+                return
+        elif cache_path.exists():
+            source = cache_path
+        elif local_path.exists():
+            source = local_path
+
+        if source is None:
+            logger.warning("No games data available to stream")
+            return
+
+        if not IJSON_AVAILABLE:
+            yield from self._read_games_cache(source) or []
+            return
+
+        with open(source, "rb") as f:
+            yield from ijson.items(f, "item")
+
+    def _read_games_cache(self, cache_path: Path) -> Optional[list]:
+        """Parse the cached games file, returning None on any error."""
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w+", suffix=".json", delete=False
-            ) as tmp_file:
-                if self._download_file(
-                    self.data_bucket, "games_clean.json", tmp_file.name
-                ):
-                    with open(tmp_file.name, "r") as f:
-                        games_data = json.load(f)
-                    os.unlink(tmp_file.name)  # Clean up temp file
-                    logger.info(f"Loaded {len(games_data)} games from Cloud Storage")
-                    return games_data
-                else:
-                    logger.warning("Failed to download from GCS, trying local fallback")
-                    return self._load_local_games_data()
+            if cache_path.suffix == ".parquet":
+                # Columnar read: typed columns materialize straight into
+                # rows, no JSON tokenizing at all
+                games_data = pq.read_table(cache_path, memory_map=True).to_pylist()
+            else:
+                # orjson parses the multi-thousand-game payload a few
+                # times faster than stdlib json, and reading bytes skips
+                # the text-mode decode
+                games_data = orjson.loads(cache_path.read_bytes())
+            logger.info(f"Loaded {len(games_data)} games from cache: {cache_path}")
+            return games_data
+        except Exception as e:
+            logger.error(f"Failed to read games cache {cache_path}: {e}")
+            return None
+
+    def _refresh_games_cache(self) -> Optional[list]:
+        """
+        Download the games catalog into the disk cache and parse it.
+
+        The columnar Parquet artifact is preferred when the bucket has one
+        and pyarrow is installed; games_clean.json remains the fallback.
+
+        Returns:
+            Parsed games list or None if the download failed
+        """
+        if PARQUET_AVAILABLE:
+            games_data = self._refresh_from_parquet()
+            if games_data is not None:
+                return games_data
+
+        cache_path = _cache_dir / "games_clean.json"
+        try:
+            # Download straight into memory and parse once; routing through
+            # a temp file would write and re-read every byte for nothing
+            blob = self._blob(self.data_bucket, "games_clean.json")
+            data = blob.download_as_bytes()
+            games_data = orjson.loads(data)
+
+            # Persist for stale-while-revalidate readers; atomic rename so
+            # concurrent readers never see a torn file
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+
+            logger.info(f"Loaded {len(games_data)} games from Cloud Storage")
+            return games_data
         except Exception as e:
             logger.error(f"Error loading games data: {e}")
-            return self._load_local_games_data()
+            return None
+
+    def _refresh_from_parquet(self) -> Optional[list]:
+        """
+        Fetch the Parquet catalog artifact when the bucket has one.
+
+        Returns:
+            Parsed games list, or None when the artifact is absent or the
+            download failed (callers fall back to JSON)
+        """
+        try:
+            blob = self._blob(self.data_bucket, "games_clean.parquet")
+            if not blob.exists():
+                return None
+
+            data = blob.download_as_bytes()
+            cache_path = _cache_dir / "games_clean.parquet"
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+
+            games_data = pq.read_table(cache_path, memory_map=True).to_pylist()
+            logger.info(f"Loaded {len(games_data)} games from Cloud Storage (Parquet)")
+            return games_data
+        except Exception as e:
+            logger.error(f"Error loading Parquet games data: {e}")
+            return None
 
     def _load_local_games_data(self) -> Optional[list]:
         """Fallback to local games data if GCS fails."""
         try:
+            if PARQUET_AVAILABLE:
+                parquet_file = Path("data/games_clean.parquet")
+                if parquet_file.exists():
+                    games_data = pq.read_table(
+                        parquet_file, memory_map=True
+                    ).to_pylist()
+                    logger.info(
+                        f"Loaded {len(games_data)} games from local Parquet file"
+                    )
+                    return games_data
+
             games_file = Path("data/games_clean.json")
             if games_file.exists():
-                with open(games_file, "r") as f:
-                    games_data = json.load(f)
+                games_data = orjson.loads(games_file.read_bytes())
                 logger.info(f"Loaded {len(games_data)} games from local file")
                 return games_data
             else:
@@ -153,24 +564,160 @@ class ModelRegistry:
         """
         Download model from Cloud Storage and return local path.
 
+        Known artifacts resolve through the shared batch download, so the
+        model and feature extractor requested back-to-back at startup cost
+        one concurrent fetch rather than two serial ones.
+
         Args:
             model_name: Name of model file in bucket
 
         Returns:
             Local path to model file or None if failed
         """
+        if model_name in _MODEL_ARTIFACTS:
+            # Hot path once resolved: a single dict read, no lock or copy
+            resolved = self._model_paths.get(model_name)
+            if resolved is not None:
+                return resolved
+            return self.get_all_models().get(model_name)
+
+        logger.warning(
+            f"Unknown model artifact requested: {model_name} "
+            f"(known: {', '.join(_MODEL_ARTIFACTS)})"
+        )
+        return self._fetch_model_path(model_name)
+
+    def get_all_models(self) -> Dict[str, Optional[str]]:
+        """
+        Resolve local paths for all model artifacts at once.
+
+        Collects the background prefetch when one is pending, otherwise
+        runs the concurrent batch download. Results are kept on the
+        instance so repeated calls are dictionary lookups.
+
+        Returns:
+            Mapping of artifact name to local path (None where unavailable)
+        """
+        self._start_prefetch()
+        future, self._model_future = self._model_future, None
+        if future is not None:
+            try:
+                resolved = future.result()
+            except Exception as e:
+                logger.error(f"Model prefetch failed: {e}")
+                resolved = None
+            if resolved:
+                with self._model_paths_lock:
+                    self._model_paths = resolved
+        with self._model_paths_lock:
+            if not self._model_paths:
+                self._model_paths = self._fetch_all_models()
+            return dict(self._model_paths)
+
+    def _fetch_all_models(self) -> Dict[str, Optional[str]]:
+        """
+        Download all model artifacts in one thread-pooled batch.
+
+        transfer_manager.download_many overlaps the per-blob round-trips so
+        wall time is the slower download, not the sum.
+
+        Returns:
+            Mapping of artifact name to local path (None where unavailable)
+        """
         if not self.storage_client:
             logger.warning("GCS not available, trying local fallback")
-            return self._get_local_model_path(model_name)
+            return {
+                name: self._get_local_model_path(name) for name in _MODEL_ARTIFACTS
+            }
 
         try:
-            with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as tmp_file:
-                if self._download_file(self.models_bucket, model_name, tmp_file.name):
-                    logger.info(f"Downloaded {model_name} to {tmp_file.name}")
-                    return tmp_file.name
+            # Fixed cache destinations instead of a fresh NamedTemporaryFile
+            # per call: disk usage stays bounded at one file per artifact
+            # even when a long-lived worker re-resolves the model
+            models_dir = _cache_dir / "models"
+            models_dir.mkdir(parents=True, exist_ok=True)
+
+            paths: Dict[str, Optional[str]] = {}
+            pairs = []
+            staging = {}
+            generations = {}
+            for name in _MODEL_ARTIFACTS:
+                final_path = models_dir / name
+                blob = self._blob(self.models_bucket, name)
+                blob.reload()
+                generation = str(blob.generation)
+                if self._generation_current(final_path, generation):
+                    logger.info(
+                        f"{name} unchanged (generation {generation}), "
+                        "skipping download"
+                    )
+                    paths[name] = str(final_path)
+                    continue
+
+                tmp_path = models_dir / f"{name}.{os.getpid()}.tmp"
+                staging[name] = tmp_path
+                generations[name] = generation
+                pairs.append((blob, str(tmp_path)))
+
+            results = (
+                transfer_manager.download_many(
+                    pairs,
+                    max_workers=4,
+                    worker_type=transfer_manager.THREAD,
+                    raise_exception=False,
+                )
+                if pairs
+                else []
+            )
+            stale = [name for name in _MODEL_ARTIFACTS if name in staging]
+            for name, result in zip(stale, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to download {name}: {result}")
+                    staging[name].unlink(missing_ok=True)
+                    paths[name] = self._get_local_model_path(name)
                 else:
-                    logger.warning("Failed to download from GCS, trying local fallback")
-                    return self._get_local_model_path(model_name)
+                    # Atomic rename so readers never see a torn pickle
+                    final_path = models_dir / name
+                    os.replace(staging[name], final_path)
+                    self._record_generation(final_path, generations[name])
+                    paths[name] = str(final_path)
+                    logger.info(f"Downloaded {name} to {final_path}")
+            return paths
+        except Exception as e:
+            logger.error(f"Error downloading model artifacts: {e}")
+            return {
+                name: self._get_local_model_path(name) for name in _MODEL_ARTIFACTS
+            }
+
+    def _fetch_model_path(self, model_name: str) -> Optional[str]:
+        """Blocking download behind get_model_path and the init prefetch."""
+        if not self.storage_client:
+            logger.warning("GCS not available, trying local fallback")
+            return self._get_local_model_path(model_name)
+
+        try:
+            models_dir = _cache_dir / "models"
+            models_dir.mkdir(parents=True, exist_ok=True)
+            final_path = models_dir / model_name
+            tmp_path = models_dir / f"{model_name}.{os.getpid()}.tmp"
+
+            if self._download_file(
+                self.models_bucket,
+                model_name,
+                str(tmp_path),
+                final_path=str(final_path),
+            ):
+                if tmp_path.exists():
+                    os.replace(tmp_path, final_path)
+                    tmp_sidecar = Path(f"{tmp_path}.generation")
+                    if tmp_sidecar.exists():
+                        os.replace(tmp_sidecar, f"{final_path}.generation")
+                    logger.info(f"Downloaded {model_name} to {final_path}")
+                return str(final_path)
+            else:
+                tmp_path.unlink(missing_ok=True)
+                logger.warning("Failed to download from GCS, trying local fallback")
+                return self._get_local_model_path(model_name)
         except Exception as e:
             logger.error(f"Error downloading model {model_name}: {e}")
             return self._get_local_model_path(model_name)
@@ -193,36 +740,126 @@ class ModelRegistry:
         """Get path to feature extractor model."""
         return self.get_model_path("recommendation_model_feature_extractor.pkl")
 
-    def health_check(self) -> Dict[str, Any]:
+    def get_model_mmap(
+        self, model_name: str = "recommendation_model.pkl"
+    ) -> Optional[memoryview]:
+        """
+        Return a read-only memory-mapped view of a model pickle.
+
+        pickle.loads accepts the view directly, so callers skip the full
+        read() copy into a bytes object — the kernel page cache backs the
+        mapping and faults pages in on demand, sharing them across worker
+        processes reading the same file.
+
+        Args:
+            model_name: Name of model file in bucket
+
+        Returns:
+            Memoryview over the mapped file or None if unavailable
+        """
+        model_path = self.get_model_path(model_name)
+        if not model_path:
+            return None
+
+        try:
+            with open(model_path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return memoryview(mapped)
+        except Exception as e:
+            logger.error(f"Failed to mmap model {model_name}: {e}")
+            return None
+
+    def health_check(self, deep: bool = True) -> Dict[str, Any]:
         """
         Check health of model registry.
 
+        Args:
+            deep: When True, connect the client and probe bucket access
+                with real requests. A shallow check only reports local
+                state and never triggers the lazy connection, so it is
+                safe for tight liveness-probe loops.
+
         Returns:
             Dictionary with health status information
         """
+        if deep:
+            self._start_prefetch()
+
         health = {
             "gcs_available": GCS_AVAILABLE,
-            "storage_client": self.storage_client is not None,
-            "data_bucket": self.data_bucket is not None,
-            "models_bucket": self.models_bucket is not None,
+            "storage_client": self._storage_client is not None,
+            "data_bucket": self._data_bucket is not None,
+            "models_bucket": self._models_bucket is not None,
             "project_id": self.project_id,
         }
 
+        if not deep:
+            return health
+
         if self.storage_client:
-            try:
-                # Test data bucket access
-                data_blob = self.data_bucket.blob("games_clean.json")
-                health["data_accessible"] = data_blob.exists()
+            now = time.time()
+            if (
+                self._probe_cache
+                and now - self._probe_cache[0] < _HEALTH_CACHE_SECONDS
+            ):
+                # Recent probe result; don't hammer GCS on tight intervals
+                data_ok, models_ok = self._probe_cache[1]
+                health["data_accessible"] = data_ok
+                health["models_accessible"] = models_ok
+                return health
 
-                # Test models bucket access
-                model_blob = self.models_bucket.blob("recommendation_model.pkl")
-                health["models_accessible"] = model_blob.exists()
+            try:
+                # Probe both buckets concurrently; the check costs the
+                # slower round-trip instead of the sum of the two. Short
+                # timeout with no retry budget so a GCS hiccup fails the
+                # probe fast instead of stalling it
+                data_blob = self._blob(self.data_bucket, "games_clean.json")
+                model_blob = self._blob(
+                    self.models_bucket, "recommendation_model.pkl"
+                )
+                data_future = self._executor.submit(
+                    data_blob.exists, timeout=_HEALTH_PROBE_TIMEOUT, retry=None
+                )
+                model_future = self._executor.submit(
+                    model_blob.exists, timeout=_HEALTH_PROBE_TIMEOUT, retry=None
+                )
+                health["data_accessible"] = data_future.result()
+                health["models_accessible"] = model_future.result()
             except Exception as e:
                 health["error"] = str(e)
                 health["data_accessible"] = False
                 health["models_accessible"] = False
+
+            self._probe_cache = (
+                now,
+                (health["data_accessible"], health["models_accessible"]),
+            )
         else:
             health["data_accessible"] = False
             health["models_accessible"] = False
 
         return health
+
+
+@functools.lru_cache(maxsize=4)
+def get_registry(
+    data_bucket: str = "igdb-recommendation-system-data",
+    models_bucket: str = "igdb-recommendation-system-models",
+    project_id: Optional[str] = None,
+) -> ModelRegistry:
+    """
+    Return a process-wide ModelRegistry for the given bucket configuration.
+
+    Constructing a registry performs the full GCS auth dance (credential
+    parsing, OAuth token fetch, TLS setup); caching per bucket tuple means
+    each worker process pays that cost once instead of per request.
+
+    Args:
+        data_bucket: Cloud Storage bucket for data files
+        models_bucket: Cloud Storage bucket for model files
+        project_id: GCP project ID (auto-detected if None)
+
+    Returns:
+        Shared ModelRegistry instance
+    """
+    return ModelRegistry(data_bucket, models_bucket, project_id)